@@ -8,6 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # Dependencia opcional: sin ella se usa la ruta Python
+    np = None
+
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor, QFont, QPainter, QPixmap
 from PyQt6.QtWidgets import (
@@ -38,11 +43,58 @@ from RuleTragaperrasJuego.sound_manager import get_sound_manager
 
 BaseCard = cardCommon.BaseCard
 BaseDeck = cardCommon.BaseDeck
+PackedDeck = cardCommon.PackedDeck
+
+# Puntos de cada índice de valor (0=A ... 12=K); el As cuenta 11 de partida
+_RANK_VALUES = (11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+_RANK_VALUE_LUT = np.array(_RANK_VALUES, dtype=np.uint8) if np is not None else None
+
+# Tabla 13x13: True si el par de índices (r1, r2) es un Blackjack (As + 10, J, Q o K)
+_BLACKJACK_PAIRS = tuple(
+    tuple((r1 == 0 and r2 >= 9) or (r2 == 0 and r1 >= 9) for r2 in range(13))
+    for r1 in range(13)
+)
+
+
+def _sum_values(ranks) -> int:
+    """Suma de puntos (As = 11) de unos índices de valor, sin ajustar Ases.
+
+    Los ndarray se resuelven con una indexación sobre la tabla; cualquier otra
+    secuencia de int (lista, array('B') de una baraja sin numpy) se recorre
+    en Python sobre la tupla de puntos.
+    """
+    if _RANK_VALUE_LUT is not None and isinstance(ranks, np.ndarray):
+        return int(_RANK_VALUE_LUT[ranks].sum())
+    return sum(_RANK_VALUES[r] for r in ranks)
+
+
+def _hand_value(ranks) -> int:
+    """Valor de una mano dada por sus índices de valor, ajustando Ases.
+
+    Acepta una secuencia de int, un array('B') o un ndarray uint8 (p. ej. un
+    tramo de ``BlackjackDeck.ranks``). Los ndarray se suman vectorizados; las
+    manos de unas pocas cartas del juego siguen la ruta Python, más barata
+    que crear un array por mano.
+    """
+    value = _sum_values(ranks)
+    if np is not None and isinstance(ranks, np.ndarray):
+        aces = int(np.count_nonzero(ranks == 0))
+    else:
+        aces = sum(1 for r in ranks if r == 0)
+
+    # Ajustar Ases de 11 a 1 si la mano se pasa de 21
+    while value > 21 and aces > 0:
+        value -= 10
+        aces -= 1
+
+    return value
 
 
 class BlackjackCard(BaseCard):
     """Carta específica para Blackjack con valores estándar"""
 
+    __slots__ = ("_rank_idx",)
+
     BLACKJACK_VALUES = [
         "A",
         "2",
@@ -59,6 +111,7 @@ class BlackjackCard(BaseCard):
         "K",
     ]
     BLACKJACK_SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
+    _RANK_INDEX = dict(zip(BLACKJACK_VALUES, range(len(BLACKJACK_VALUES))))
 
     def __init__(self, value, suit):
         if value not in self.BLACKJACK_VALUES:
@@ -66,31 +119,24 @@ class BlackjackCard(BaseCard):
         if suit not in self.BLACKJACK_SUITS:
             raise ValueError(f"Palo inválido: {suit}")
         super().__init__(value, suit)
+        self._rank_idx = self._RANK_INDEX[value]
 
     def get_numeric_value(self) -> int:
         """Devuelve el valor numérico básico de la carta para Blackjack"""
-        if self.value in ["J", "Q", "K"]:
-            return 10
-        elif self.value == "A":
-            return 11  # Aces default to 11, adjusted later if needed
-        else:
-            return int(self.value)
+        # Aces default to 11, adjusted later if needed
+        return _RANK_VALUES[self._rank_idx]
 
     def is_ace(self) -> bool:
         """Verifica si la carta es un As"""
         return self.value == "A"
 
 
-class BlackjackDeck(BaseDeck):
+class BlackjackDeck(PackedDeck):
     """Baraja estándar de 52 cartas para Blackjack"""
 
-    def _create_deck(self) -> list:
-        """Crea una baraja completa de Blackjack"""
-        self.cards = []
-        for suit in BlackjackCard.BLACKJACK_SUITS:
-            for value in BlackjackCard.BLACKJACK_VALUES:
-                self.cards.append(BlackjackCard(value, suit))
-        return self.cards
+    CARD_CLASS = BlackjackCard
+    RANK_NAMES = tuple(BlackjackCard.BLACKJACK_VALUES)
+    SUIT_NAMES = tuple(BlackjackCard.BLACKJACK_SUITS)
 
 
 class GameState(Enum):
@@ -129,19 +175,11 @@ class BlackjackGame:
 
     def calculate_hand_value(self, hand: List[BlackjackCard]) -> int:
         """Calcula el valor de una mano, ajustando Ases si es necesario"""
-        value = sum(card.get_numeric_value() for card in hand)
-        aces = sum(1 for card in hand if card.is_ace())
-
-        # Ajustar Ases de 11 a 1 si la mano se pasa de 21
-        while value > 21 and aces > 0:
-            value -= 10
-            aces -= 1
-
-        return value
+        return _hand_value([card._rank_idx for card in hand])
 
     def is_blackjack(self, hand: List[BlackjackCard]) -> bool:
         """Verifica si una mano es Blackjack (21 con 2 cartas)"""
-        return len(hand) == 2 and self.calculate_hand_value(hand) == 21
+        return len(hand) == 2 and _BLACKJACK_PAIRS[hand[0]._rank_idx][hand[1]._rank_idx]
 
     def can_double(self) -> bool:
         """Verifica si el jugador puede doblar"""
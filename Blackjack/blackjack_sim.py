@@ -0,0 +1,167 @@
+"""Simulación Monte Carlo de manos de Blackjack.
+
+Juega manos independientes con las mismas reglas que ``BlackjackGame``
+(el dealer pide hasta 17, el Blackjack paga 3:2) trabajando solo con índices
+de valor (0=A ... 12=K). Con Numba disponible el bucle se compila y las manos
+se reparten entre hilos con ``prange``; sin él se ejecuta la misma lógica en
+Python (también sin numpy). No importa PyQt6, así que puede usarse en
+scripts sin interfaz.
+"""
+
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Dependencia opcional: sin ella las manos van en listas
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # Dependencia opcional: sin ella se usa la ruta Python
+    njit = None
+    prange = range
+
+# Resultado de cada mano, desde el punto de vista del jugador
+LOSS = -1
+PUSH = 0
+WIN = 1
+BLACKJACK = 2
+
+# Puntos de cada índice de valor; el As cuenta 11 de partida (igual que blackjack.py)
+_RANK_POINTS = (11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+# Baraja de 52 cartas como índices de valor: cuatro de cada
+_SHOE = [rank for rank in range(13) for _ in range(4)]
+
+# Generador propio de la ruta Python: sembrar una mano no toca np.random
+_PY_RNG = random.Random()
+
+
+def _seed_hand(seed):
+    """Fija la semilla de la mano que se va a jugar"""
+    _PY_RNG.seed(int(seed))
+
+
+def _randint(low, high):
+    """Entero aleatorio en [low, high)"""
+    return _PY_RNG.randrange(low, high)
+
+
+def _draw(shoe, k):
+    """Saca la carta k barajando sobre la marcha (Fisher-Yates parcial)"""
+    j = _randint(k, len(shoe))
+    card = shoe[j]
+    shoe[j] = shoe[k]
+    shoe[k] = card
+    return card
+
+
+def _add_card(total, soft_aces, rank):
+    """Suma una carta a la mano y pasa Ases de 11 a 1 mientras se pase de 21"""
+    total += _RANK_POINTS[rank]
+    if rank == 0:
+        soft_aces += 1
+    while total > 21 and soft_aces > 0:
+        total -= 10
+        soft_aces -= 1
+    return total, soft_aces
+
+
+def _play_one_hand(seed, stand_on):
+    """Juega una mano completa con su propia semilla y devuelve el resultado"""
+    _seed_hand(seed)
+    shoe = _SHOE.copy()
+
+    # Reparto inicial en el mismo orden que start_new_hand
+    player, player_aces = _add_card(0, 0, _draw(shoe, 0))
+    dealer, dealer_aces = _add_card(0, 0, _draw(shoe, 1))
+    player, player_aces = _add_card(player, player_aces, _draw(shoe, 2))
+    dealer, dealer_aces = _add_card(dealer, dealer_aces, _draw(shoe, 3))
+    k = 4
+
+    player_blackjack = player == 21
+    dealer_blackjack = dealer == 21
+    if player_blackjack:
+        # Como en el juego: la mano se resuelve sin que el dealer pida
+        return PUSH if dealer_blackjack else BLACKJACK
+
+    # Estrategia fija: pedir hasta llegar a stand_on
+    while player < stand_on:
+        player, player_aces = _add_card(player, player_aces, _draw(shoe, k))
+        k += 1
+    if player > 21:
+        return LOSS
+
+    # El dealer debe pedir hasta llegar a 17 o más
+    while dealer < 17:
+        dealer, dealer_aces = _add_card(dealer, dealer_aces, _draw(shoe, k))
+        k += 1
+
+    if dealer > 21:
+        return WIN
+    if dealer_blackjack:
+        return LOSS
+    if player > dealer:
+        return WIN
+    if dealer > player:
+        return LOSS
+    return PUSH
+
+
+def _simulate(seeds, stand_on, results):
+    """Juega una mano por semilla; con Numba las manos corren en paralelo"""
+    for i in prange(len(seeds)):
+        results[i] = _play_one_hand(seeds[i], stand_on)
+    return results
+
+
+if njit is not None:
+    _RANK_POINTS = np.array(_RANK_POINTS, dtype=np.int64)
+    _SHOE = np.array(_SHOE, dtype=np.uint8)
+
+    @njit(cache=True)
+    def _seed_hand(seed):
+        """Fija la semilla de la mano en el generador propio de Numba (por hilo)"""
+        np.random.seed(seed)
+
+    @njit(cache=True)
+    def _randint(low, high):
+        """Entero aleatorio en [low, high)"""
+        return np.random.randint(low, high)
+
+    # Cada función compilada resuelve a las demás ya compiladas por nombre global;
+    # se compilan (o se cargan de la caché) en la primera llamada
+    _draw = njit(cache=True)(_draw)
+    _add_card = njit(cache=True)(_add_card)
+    _play_one_hand = njit(cache=True)(_play_one_hand)
+    _simulate = njit(parallel=True, cache=True)(_simulate)
+
+
+def simulate_hands(n_hands: int, stand_on: int = 17, seed: Optional[int] = None):
+    """Simula ``n_hands`` manos y devuelve sus resultados como array int8.
+
+    El jugador pide carta mientras su mano valga menos de ``stand_on``. Cada
+    mano usa la semilla ``seed + i``, así que con la misma ``seed`` el
+    resultado es idéntico sea cual sea el hilo que juegue cada mano. Sin
+    numpy el resultado es un ``array('b')``.
+    """
+    if seed is None:
+        seed = random.getrandbits(32)
+    if np is None:
+        seeds = [(seed + i) % 2**32 for i in range(n_hands)]
+        return _simulate(seeds, stand_on, array('b', bytes(n_hands)))
+    seeds = ((np.arange(n_hands, dtype=np.uint64) + np.uint64(seed)) % 2**32).astype(np.uint32)
+    return _simulate(seeds, stand_on, np.empty(n_hands, dtype=np.int8))
+
+
+def expected_return(results) -> float:
+    """Ganancia media por unidad apostada (Blackjack paga 3:2)"""
+    if len(results) == 0:
+        return 0.0
+    if np is None:
+        return sum(1.5 if r == BLACKJACK else r for r in results) / len(results)
+    payouts = np.where(results == BLACKJACK, 1.5, results.astype(np.float64))
+    return float(payouts.mean())
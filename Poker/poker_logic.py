@@ -10,6 +10,8 @@ import sys
 from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import combinations
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -426,26 +428,14 @@ class PokerTable:
         if len(cards) != 7:
             raise ValueError("Must evaluate exactly 7 cards")
 
-        # Get all possible 5-card combinations
-        from itertools import combinations
-
-        best_hand = None
-        best_ranking = HandRanking.HIGH_CARD
-        best_tiebreakers = []
-
-        for combo in combinations(cards, 5):
-            ranking, tiebreakers = self._evaluate_5_card_hand(list(combo))
-            if ranking.value > best_ranking.value or (
-                ranking.value == best_ranking.value and tiebreakers > best_tiebreakers
-            ):
-                best_hand = combo
-                best_ranking = ranking
-                best_tiebreakers = tiebreakers
-
-        return best_ranking, best_tiebreakers
+        # The result depends only on which cards are held, not their order
+        key = tuple(sorted((card.value, card.suit) for card in cards))
+        ranking, tiebreakers = _best_hand(key)
+        return ranking, list(tiebreakers)
 
+    @staticmethod
     def _evaluate_5_card_hand(
-        self, cards: List[PokerCard]
+        cards: List[PokerCard],
     ) -> Tuple[HandRanking, List[int]]:
         """Evaluate exactly 5 cards and return ranking with tiebreakers"""
         values = [card.get_numeric_value() for card in cards]
@@ -779,3 +769,27 @@ class PokerTable:
         else:
             # Fallback
             return valid_actions[0], 0
+
+
+@lru_cache(maxsize=4096)
+def _best_hand(
+    key: Tuple[Tuple[str, str], ...]
+) -> Tuple[HandRanking, Tuple[int, ...]]:
+    """Best 5-card hand among the 7 (value, suit) pairs in ``key``.
+
+    The C(7,5)=21 combinations are scored once per set of cards; tiebreakers
+    are stored as a tuple so callers cannot mutate the cached result.
+    """
+    cards = [PokerCard(value, suit) for value, suit in key]
+    best_ranking = HandRanking.HIGH_CARD
+    best_tiebreakers: List[int] = []
+
+    for combo in combinations(cards, 5):
+        ranking, tiebreakers = PokerTable._evaluate_5_card_hand(list(combo))
+        if ranking.value > best_ranking.value or (
+            ranking.value == best_ranking.value and tiebreakers > best_tiebreakers
+        ):
+            best_ranking = ranking
+            best_tiebreakers = tiebreakers
+
+    return best_ranking, tuple(best_tiebreakers)
@@ -13,6 +13,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6.QtCore import (
     QEasingCurve,
+    QPointF,
     QPropertyAnimation,
     QRect,
     QSize,
@@ -31,9 +32,10 @@ from PyQt6.QtGui import (
     QPen,
     QPixmap,
     QResizeEvent,
+    QStaticText,
+    QTransform,
 )
 from PyQt6.QtWidgets import (
-    QApplication,
     QFrame,
     QGraphicsDropShadowEffect,
     QGridLayout,
@@ -77,6 +79,14 @@ class PokerWindow(QMainWindow):
     Inherits responsive scaling capabilities.
     """
 
+    # Color y símbolo por palo, construidos una sola vez para todo el pintado.
+    _SUIT_RENDER: Dict[str, tuple[QColor, str]] = {
+        "Corazones": (QColor(220, 20, 60), "♥"),
+        "Diamantes": (QColor(220, 20, 60), "♦"),
+        "Picas": (QColor(0, 0, 0), "♠"),
+        "Tréboles": (QColor(0, 0, 0), "♣"),
+    }
+
     def __init__(
         self,
         table_type: str = "nine_player",
@@ -87,6 +97,11 @@ class PokerWindow(QMainWindow):
 
         # Qt puede emitir resizeEvent durante la construcción; la caché debe existir antes.
         self._card_pixmap_cache: Dict[tuple[str, str, int, int], QPixmap] = {}
+        self._fonts: Dict[tuple[int, int], QFont] = {}
+        self._font_metrics: Dict[tuple[int, int], QFontMetrics] = {}
+        self._static_texts: Dict[tuple[str, int, int], QStaticText] = {}
+        # Último texto puesto en cada etiqueta/botón (ver _set_label_text_if_changed)
+        self._label_texts: Dict[QWidget, str] = {}
 
         # Initialize config system
         self.config = config_manager
@@ -96,6 +111,7 @@ class PokerWindow(QMainWindow):
         self.base_width = 1400
         self.base_height = 900
         self.current_scale = 1.0
+        self._recompute_scaled_sizes()
 
         self.setWindowTitle(get_text("poker") + " - " + get_text("casino_title"))
         self.setGeometry(100, 100, 1200, 800)
@@ -210,7 +226,7 @@ class PokerWindow(QMainWindow):
         self.setWindowTitle(get_text("poker") + " - " + get_text("casino_title"))
         # Update other text elements as needed
         if hasattr(self, "new_hand_button"):
-            self.new_hand_button.setText(get_text("new_hand"))
+            self._set_label_text_if_changed(self.new_hand_button, get_text("new_hand"))
 
     def update_animation_settings(self):
         """Update animation settings"""
@@ -337,9 +353,8 @@ class PokerWindow(QMainWindow):
             card_width = self.get_scaled_size(70)
             card_height = self.get_scaled_size(100)
             card_label.setFixedSize(card_width, card_height)
-            card_label.setStyleSheet(self.get_card_back_style())
             card_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            card_label.setText("?")
+            card_label.setPixmap(self._card_back_pixmap(card_width, card_height))
             card_label.setFont(self.get_scaled_font(24, QFont.Weight.Bold))
 
             # Add shadow effect
@@ -412,9 +427,10 @@ class PokerWindow(QMainWindow):
         for i in range(2):
             card_label = QLabel()
             card_label.setFixedSize(self.get_scaled_size(45), self.get_scaled_size(65))
-            card_label.setStyleSheet(self.get_card_back_style())
             card_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            card_label.setText("?")
+            card_label.setPixmap(
+                self._card_back_pixmap(card_label.width(), card_label.height())
+            )
             card_label.setFont(self.get_scaled_font(16, QFont.Weight.Bold))
             card_labels.append(card_label)
             cards_layout.addWidget(card_label)
@@ -606,13 +622,15 @@ class PokerWindow(QMainWindow):
 
         # Check / Call button
         if PlayerAction.CHECK in actions:
-            self.check_call_button.setText("Check")
+            self._set_label_text_if_changed(self.check_call_button, "Check")
             self.check_call_button.setVisible(True)
             self.check_call_button.setEnabled(True)
             self.check_call_current_action = PlayerAction.CHECK
         elif PlayerAction.CALL in actions:
             call_amount = self.table.current_bet - current_player.current_bet
-            self.check_call_button.setText(f"Call ${call_amount}")
+            self._set_label_text_if_changed(
+                self.check_call_button, f"Call ${call_amount}"
+            )
             self.check_call_button.setVisible(True)
             self.check_call_button.setEnabled(True)
             self.check_call_current_action = PlayerAction.CALL
@@ -640,7 +658,7 @@ class PokerWindow(QMainWindow):
                 can_raise = False
 
         if can_raise:
-            self.raise_button.setText("Raise")
+            self._set_label_text_if_changed(self.raise_button, "Raise")
             self.raise_button.setVisible(True)
             self.raise_button.setEnabled(True)
             self.raise_slider.setVisible(True)
@@ -828,7 +846,7 @@ class PokerWindow(QMainWindow):
 
     def on_raise_slider_changed(self, value: int):
         """Keep the raise amount label in sync with the slider."""
-        self.raise_amount_label.setText(f"${value}")
+        self._set_label_text_if_changed(self.raise_amount_label, f"${value}")
 
     def hide_action_buttons(self):
         """Hide all action buttons and raise controls."""
@@ -864,10 +882,7 @@ class PokerWindow(QMainWindow):
         """Update all UI elements with current game state"""
         # Update pot and phase with animations
         if self.pot_label:
-            old_pot_text = self.pot_label.text()
-            new_pot_text = f"${self.table.pot}"
-            if old_pot_text != new_pot_text:
-                self.pot_label.setText(new_pot_text)
+            if self._set_label_text_if_changed(self.pot_label, f"${self.table.pot}"):
                 self.animate_pot_update()
 
         if self.phase_label:
@@ -879,10 +894,18 @@ class PokerWindow(QMainWindow):
         # Update player displays
         self.update_player_displays()
 
-    def _set_label_text_if_changed(self, label: QLabel, text: str):
-        """Avoid redundant text updates on labels."""
-        if label.text() != text:
-            label.setText(text)
+    def _set_label_text_if_changed(self, label: QLabel | QPushButton, text: str) -> bool:
+        """Avoid redundant text updates on labels.
+
+        The last text is kept in a plain dict keyed by widget, so the unchanged
+        case is a Python lookup instead of a Qt call. Every text update of a
+        cached widget must go through this helper.
+        """
+        if self._label_texts.get(label) == text:
+            return False
+        label.setText(text)
+        self._label_texts[label] = text
+        return True
 
     def _set_label_style_if_changed(self, label: QLabel, style: str):
         """Avoid redundant stylesheet updates on labels."""
@@ -902,6 +925,8 @@ class PokerWindow(QMainWindow):
         if label.property("_last_card_key") != card_key:
             label.setPixmap(pixmap)
             label.setProperty("_last_card_key", card_key)
+            # setPixmap borra el texto del QLabel; la caché debe reflejarlo.
+            self._label_texts[label] = ""
 
         self._set_label_text_if_changed(label, text)
         self._set_label_style_if_changed(label, style)
@@ -917,19 +942,16 @@ class PokerWindow(QMainWindow):
                     i,
                     str(card.value),
                     str(card.suit),
-                    self.get_scaled_size(70),
-                    self.get_scaled_size(100),
+                    self._card_width,
+                    self._card_height,
                 )
                 self._set_card_label_state(card_label, card_key, pixmap, "", "")
             else:
-                back_style = self.get_card_back_style()
-                back_key = (
-                    "community_back",
-                    i,
-                    self.get_scaled_size(70),
-                    self.get_scaled_size(100),
+                back_key = ("back", card_label.width(), card_label.height())
+                back_pixmap = self._card_back_pixmap(
+                    card_label.width(), card_label.height()
                 )
-                self._set_card_label_state(card_label, back_key, QPixmap(), "?", back_style)
+                self._set_card_label_state(card_label, back_key, back_pixmap, "", "")
 
     def update_player_displays(self):
         """Update all player displays"""
@@ -1000,31 +1022,54 @@ class PokerWindow(QMainWindow):
                                 j,
                                 str(card.value),
                                 str(card.suit),
-                                self.get_scaled_size(70),
-                                self.get_scaled_size(100),
+                                self._card_width,
+                                self._card_height,
                             )
                             self._set_card_label_state(card_label, card_key, pixmap, "", "")
                         else:
-                            back_style = self.get_card_back_style()
-                            back_key = (
-                                "player_back",
-                                i,
-                                j,
-                                self.get_scaled_size(70),
-                                self.get_scaled_size(100),
+                            back_key = ("back", card_label.width(), card_label.height())
+                            back_pixmap = self._card_back_pixmap(
+                                card_label.width(), card_label.height()
                             )
                             self._set_card_label_state(
-                                card_label,
-                                back_key,
-                                QPixmap(),
-                                "?",
-                                back_style,
+                                card_label, back_key, back_pixmap, "", ""
                             )
 
+    def _card_back_pixmap(self, width: int, height: int) -> QPixmap:
+        """Render the card back once per size and share it across all hidden cards."""
+        cache_key = ("back", "?", width, height)
+        cached = self._card_pixmap_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(37, 99, 235, 230))
+        gradient.setColorAt(1, QColor(29, 78, 216, 230))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(QColor(147, 197, 253, 153), 2))
+        painter.drawRoundedRect(1, 1, width - 2, height - 2, 8, 8)
+
+        painter.setPen(QPen(QColor(255, 255, 255)))
+        painter.setFont(self._font(max(10, height // 4), QFont.Weight.Bold))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "?")
+
+        painter.end()
+        self._card_pixmap_cache[cache_key] = pixmap
+        return pixmap
+
     def load_card_image(self, card: PokerCard) -> QPixmap:
         """Create a visual representation of a card"""
-        card_width = self.get_scaled_size(70)
-        card_height = self.get_scaled_size(100)
+        card_width = self._card_width
+        card_height = self._card_height
+        value_size, symbol_size, large_value_size, large_symbol_size = (
+            self._card_font_sizes
+        )
 
         cache_key = (str(card.value), str(card.suit), card_width, card_height)
         cached = self._card_pixmap_cache.get(cache_key)
@@ -1043,47 +1088,91 @@ class PokerWindow(QMainWindow):
         painter.drawRoundedRect(1, 1, card_width - 2, card_height - 2, 8, 8)
 
         # Determine card color
-        if card.suit in ["Corazones", "Diamantes"]:
-            color = QColor(220, 20, 60)  # Red
-            symbol = "♥" if card.suit == "Corazones" else "♦"
-        else:
-            color = QColor(0, 0, 0)  # Black
-            symbol = "♠" if card.suit == "Picas" else "♣"
+        color, symbol = self._SUIT_RENDER.get(card.suit, self._SUIT_RENDER["Tréboles"])
 
         painter.setPen(QPen(color))
 
+        bold = QFont.Weight.Bold
+        normal = QFont.Weight.Normal
+
         # Draw value in top-left
-        font = QFont("Arial", self.get_scaled_size(12), QFont.Weight.Bold)
-        painter.setFont(font)
-        painter.drawText(8, 20, card.value)
+        self._draw_glyph(painter, 8, 20, card.value, value_size, bold)
 
         # Draw suit symbol in top-left
-        font_symbol = QFont("Arial", self.get_scaled_size(10))
-        painter.setFont(font_symbol)
-        painter.drawText(8, 35, symbol)
+        self._draw_glyph(painter, 8, 35, symbol, symbol_size, normal)
 
         # Draw large value in center
-        font_large = QFont("Arial", self.get_scaled_size(20), QFont.Weight.Bold)
-        painter.setFont(font_large)
-        fm = QFontMetrics(font_large)
-        value_width = fm.horizontalAdvance(card.value)
-        painter.drawText(
-            card_width // 2 - value_width // 2, card_height // 2, card.value
+        value_width = self._metrics(large_value_size, bold).horizontalAdvance(card.value)
+        self._draw_glyph(
+            painter,
+            card_width // 2 - value_width // 2,
+            card_height // 2,
+            card.value,
+            large_value_size,
+            bold,
         )
 
         # Draw large symbol in center-bottom
-        font_symbol_large = QFont("Arial", self.get_scaled_size(16), QFont.Weight.Bold)
-        painter.setFont(font_symbol_large)
-        fm_symbol = QFontMetrics(font_symbol_large)
-        symbol_width = fm_symbol.horizontalAdvance(symbol)
-        painter.drawText(
-            card_width // 2 - symbol_width // 2, int(card_height * 0.75), symbol
+        symbol_width = self._metrics(large_symbol_size, bold).horizontalAdvance(symbol)
+        self._draw_glyph(
+            painter,
+            card_width // 2 - symbol_width // 2,
+            int(card_height * 0.75),
+            symbol,
+            large_symbol_size,
+            bold,
         )
 
         painter.end()
         self._card_pixmap_cache[cache_key] = pixmap
         return pixmap
 
+    def _font(self, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+        """Return a cached Arial font for the given size and weight."""
+        key = (size, weight.value)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont("Arial", size, weight)
+            self._fonts[key] = font
+        return font
+
+    def _metrics(
+        self, size: int, weight: QFont.Weight = QFont.Weight.Normal
+    ) -> QFontMetrics:
+        """Return cached metrics for the font produced by ``_font``."""
+        key = (size, weight.value)
+        metrics = self._font_metrics.get(key)
+        if metrics is None:
+            metrics = QFontMetrics(self._font(size, weight))
+            self._font_metrics[key] = metrics
+        return metrics
+
+    def _draw_glyph(
+        self,
+        painter: QPainter,
+        x: int,
+        baseline_y: int,
+        text: str,
+        size: int,
+        weight: QFont.Weight,
+    ):
+        """Draw text through a cached, pre-laid-out QStaticText.
+
+        ``drawStaticText`` positions the top-left corner, so the baseline
+        coordinate used by ``drawText`` is shifted by the font ascent.
+        """
+        key = (text, size, weight.value)
+        static_text = self._static_texts.get(key)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), self._font(size, weight))
+            self._static_texts[key] = static_text
+
+        painter.setFont(self._font(size, weight))
+        ascent = self._metrics(size, weight).ascent()
+        painter.drawStaticText(QPointF(x, baseline_y - ascent), static_text)
+
     # Event callbacks
     def on_hand_started(self):
         """Called when a new hand starts"""
@@ -1102,7 +1191,6 @@ class PokerWindow(QMainWindow):
         self.bot_timer.stop()
         self.reveal_all_hands = True
         self.update_display()
-        QApplication.processEvents()
         self.hide_action_buttons()
 
         if results:
@@ -1194,6 +1282,17 @@ class PokerWindow(QMainWindow):
         scale = max(0.65, min(width_scale, height_scale, 2.0))
         return max(1, int(base_size * scale))
 
+    def _recompute_scaled_sizes(self):
+        """Precompute card dimensions and font sizes for the current window size."""
+        self._card_width = self.get_scaled_size(70)
+        self._card_height = self.get_scaled_size(100)
+        self._card_font_sizes = (
+            self.get_scaled_size(12),
+            self.get_scaled_size(10),
+            self.get_scaled_size(20),
+            self.get_scaled_size(16),
+        )
+
     def get_scaled_font(
         self, base_size: int, weight: QFont.Weight = QFont.Weight.Normal
     ) -> QFont:
@@ -1260,19 +1359,6 @@ class PokerWindow(QMainWindow):
             }}
         """
 
-    def get_card_back_style(self) -> str:
-        return """
-            QLabel {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                           stop:0 rgba(37, 99, 235, 0.9),
-                           stop:1 rgba(29, 78, 216, 0.9));
-                border: 2px solid rgba(147, 197, 253, 0.6);
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-            }
-        """
-
     def get_action_panel_style(self) -> str:
         return """
             QFrame {
@@ -1316,6 +1402,8 @@ class PokerWindow(QMainWindow):
 
         if not hasattr(self, "_card_pixmap_cache"):
             self._card_pixmap_cache = {}
+        # Dimensiones de carta y fuentes: una vez por resize, no por carta pintada.
+        self._recompute_scaled_sizes()
 
         current_size = self.size()
         width_scale = current_size.width() / self.base_width
@@ -1330,6 +1418,9 @@ class PokerWindow(QMainWindow):
 
     def update_ui_scaling(self):
         """Update UI elements when scale changes"""
+        self._fonts.clear()
+        self._font_metrics.clear()
+        self._static_texts.clear()
         # This would update all scalable elements
         # Implementation depends on specific scaling needs
         pass
@@ -11,6 +11,7 @@ Incluye:
 from __future__ import annotations
 
 import random
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Tuple, Optional, Dict
@@ -36,6 +37,15 @@ class BetType(Enum):
 # Configuración de números rojos en la ruleta europea
 RED_NUMBERS = {1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36}
 BLACK_NUMBERS = {2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35}
+# Máscara de bits de los números rojos: (RED_MASK >> n) & 1 evita el hash del set
+RED_MASK = sum(1 << n for n in RED_NUMBERS)
+
+# Números cubiertos por las apuestas simples, precalculados una sola vez.
+# Cada apuesta recibe su propia lista copiada desde la tupla (copia en C).
+EVEN_NUMBERS = tuple(range(2, 37, 2))
+ODD_NUMBERS = tuple(range(1, 37, 2))
+HIGH_NUMBERS = tuple(range(19, 37))
+LOW_NUMBERS = tuple(range(1, 19))
 
 
 @dataclass
@@ -127,16 +137,20 @@ class RouletteGame:
         if len(self.history) > 20:
             self.history.pop(0)
         
-        # Calcular ganancias
-        total_winnings = 0
-        for bet in self.bets:
-            total_winnings += bet.calculate_payout(winning_number)
+        total_winnings = self.calculate_total_winnings(winning_number)
         
         self.balance += total_winnings
         self.bets = []  # Limpiar apuestas después del giro
         
         return winning_number, total_winnings
     
+    def calculate_total_winnings(self, winning_number: int) -> int:
+        """Calcula las ganancias totales de las apuestas activas para un número"""
+        total_winnings = 0
+        for bet in self.bets:
+            total_winnings += bet.calculate_payout(winning_number)
+        return total_winnings
+    
     def create_straight_up_bet(self, number: int, amount: int) -> Optional[Bet]:
         """Crea una apuesta a pleno (un número)"""
         if number < 0 or number > 36:
@@ -196,20 +210,16 @@ class RouletteGame:
     def create_even_odd_bet(self, even: bool, amount: int) -> Bet:
         """Crea una apuesta a par o impar"""
         if even:
-            numbers = [n for n in range(2, 37, 2)]
-            return Bet(BetType.EVEN, numbers, amount)
+            return Bet(BetType.EVEN, list(EVEN_NUMBERS), amount)
         else:
-            numbers = [n for n in range(1, 37, 2)]
-            return Bet(BetType.ODD, numbers, amount)
+            return Bet(BetType.ODD, list(ODD_NUMBERS), amount)
     
     def create_high_low_bet(self, high: bool, amount: int) -> Bet:
         """Crea una apuesta a alto (19-36) o bajo (1-18)"""
         if high:
-            numbers = list(range(19, 37))
-            return Bet(BetType.HIGH, numbers, amount)
+            return Bet(BetType.HIGH, list(HIGH_NUMBERS), amount)
         else:
-            numbers = list(range(1, 19))
-            return Bet(BetType.LOW, numbers, amount)
+            return Bet(BetType.LOW, list(LOW_NUMBERS), amount)
     
     def get_statistics(self) -> Dict[str, int]:
         """Devuelve estadísticas del historial"""
@@ -223,11 +233,13 @@ class RouletteGame:
                 "odd_count": 0,
             }
         
+        # Un único recorrido del historial; el resto se deriva de los conteos por número
+        counts = Counter(self.history)
         return {
             "total_spins": len(self.history),
-            "red_count": sum(1 for n in self.history if n in RED_NUMBERS),
-            "black_count": sum(1 for n in self.history if n in BLACK_NUMBERS),
-            "zero_count": sum(1 for n in self.history if n == 0),
-            "even_count": sum(1 for n in self.history if n > 0 and n % 2 == 0),
-            "odd_count": sum(1 for n in self.history if n > 0 and n % 2 == 1),
+            "red_count": sum(counts[n] for n in RED_NUMBERS),
+            "black_count": sum(counts[n] for n in BLACK_NUMBERS),
+            "zero_count": counts[0],
+            "even_count": sum(counts[n] for n in range(2, 37, 2)),
+            "odd_count": sum(counts[n] for n in range(1, 37, 2)),
         }
@@ -6,6 +6,7 @@ desde el menú principal o como aplicación independiente.
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 from PyQt6.QtWidgets import QApplication
 
@@ -16,17 +17,39 @@ if str(parent_dir) not in sys.path:
 
 from Ruleta.ruleta_ui import RouletteWindow
 
+# Ventana reutilizada mientras siga abierta para no reconstruir la mesa completa.
+_roulette_window: Optional[RouletteWindow] = None
 
-def main():
-    """Entry point for standalone roulette game"""
+
+def _ensure_app():
+    """Devuelve (app, owns_app) reutilizando la QApplication existente si la hay."""
     app = QApplication.instance()
-    owns_app = app is None
+    if app is None:
+        return QApplication(sys.argv), True
+    return app, False
 
-    if owns_app:
-        app = QApplication(sys.argv)
 
-    window = RouletteWindow()
+def _show_roulette_window(parent=None) -> RouletteWindow:
+    """Muestra la ventana de ruleta, creándola solo si no hay una visible."""
+    global _roulette_window
+    window = _roulette_window
+    try:
+        reusable = window is not None and window.isVisible()
+    except RuntimeError:  # El objeto C++ ya fue destruido
+        reusable = False
+
+    if not reusable:
+        window = RouletteWindow(parent)
+        _roulette_window = window
+
     window.show()
+    return window
+
+
+def main():
+    """Entry point for standalone roulette game"""
+    app, owns_app = _ensure_app()
+    window = _show_roulette_window()
 
     if owns_app and app is not None:
         sys.exit(app.exec())
@@ -36,15 +59,8 @@ def main():
 
 def open_roulette_window(parent=None):
     """Open roulette window from main UI"""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-        owns_app = True
-    else:
-        owns_app = False
-
-    window = RouletteWindow(parent)
-    window.show()
+    app, owns_app = _ensure_app()
+    window = _show_roulette_window(parent)
 
     return window, owns_app, app
 
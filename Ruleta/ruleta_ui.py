@@ -10,13 +10,30 @@ Implementa la UI completa con:
 
 import math
 import sys
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPalette, QPen
+from PyQt6.QtCore import QRectF, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QGuiApplication,
+    QPainter,
+    QPainterPath,
+    QPalette,
+    QPen,
+    QPixmap,
+    QSurfaceFormat,
+)
 from PyQt6.QtWidgets import (
     QFrame,
+    QGraphicsLineItem,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+    QGraphicsView,
     QGridLayout,
     QHBoxLayout,
     QLabel,
@@ -29,6 +46,11 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # PyQt6 sin el módulo OpenGL
+    QOpenGLWidget = None
+
 # Add parent directory to path for imports
 parent_dir = Path(__file__).resolve().parent.parent
 package_parent_dir = parent_dir.parent
@@ -39,7 +61,7 @@ for path_entry in (package_parent_dir, parent_dir):
 
 from RuleTragaperrasJuego.Ruleta.ruleta_logic import (
     BLACK_NUMBERS,
-    RED_NUMBERS,
+    RED_MASK,
     BetType,
     RouletteGame,
 )
@@ -47,22 +69,170 @@ from RuleTragaperrasJuego.config import config_manager
 from RuleTragaperrasJuego.game_events import GameRoundEvent, get_game_event_service
 from RuleTragaperrasJuego.sound_manager import get_sound_manager
 
+# Animación del giro: tope de frames por segundo y constante de tiempo (s)
+# de la desaceleración exponencial, independiente de la tasa real de frames.
+FPS = 60
+SPIN_DECAY_TAU = 0.39
+
+# Plataformas Qt sin contexto OpenGL real; la ruleta usa el raster por software
+_NO_GL_PLATFORMS = frozenset({"offscreen", "minimal", "vnc"})
+
+# Fuentes compartidas por todos los widgets de la ruleta
+_FONT_NUMBER_BTN = QFont("Arial", 10, QFont.Weight.Bold)
+_FONT_SPECIAL_BTN = QFont("Arial", 9, QFont.Weight.Bold)
+_FONT_TITLE = QFont("Arial", 16, QFont.Weight.Bold)
+_FONT_LARGE_BOLD = QFont("Arial", 14, QFont.Weight.Bold)
+_FONT_LARGE = QFont("Arial", 14)
+_FONT_MEDIUM = QFont("Arial", 12)
+_FONT_SMALL = QFont("Arial", 10)
+
+# Orden de números en la ruleta europea
+# fmt: off
+_WHEEL_NUMBERS = (
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10,
+    5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26,
+)
+# fmt: on
+
+# Ángulos de los sectores en 1/16 de grado, calculados una vez como enteros
+_SPAN16 = round(360 * 16 / 37)
+_STARTS16 = tuple(round(i * 360 * 16 / 37) for i in range(37))
+
+# Pincel y brochas compartidos por los 37 sectores
+_GOLD_PEN = QPen(QColor("#FFD700"), 1)
+_BRUSH_GREEN = QBrush(QColor("#006400"))
+_BRUSH_RED = QBrush(QColor("#8B0000"))
+_BRUSH_BLACK = QBrush(QColor("#000000"))
+
+# (brocha, ángulo inicial, amplitud) de cada sector, en 1/16 de grado
+_SECTOR_PAINT = tuple(
+    (
+        (
+            _BRUSH_GREEN
+            if number == 0
+            else _BRUSH_RED if (RED_MASK >> number) & 1 else _BRUSH_BLACK
+        ),
+        _STARTS16[i],
+        _SPAN16,
+    )
+    for i, number in enumerate(_WHEEL_NUMBERS)
+)
+
+# Sectores agrupados por brocha para rellenar cada color con un solo trazado
+_SECTOR_GROUPS = tuple(
+    (
+        brush,
+        tuple(
+            (start_angle_16, span_16)
+            for sector_brush, start_angle_16, span_16 in _SECTOR_PAINT
+            if sector_brush is brush
+        ),
+    )
+    for brush in (_BRUSH_GREEN, _BRUSH_RED, _BRUSH_BLACK)
+)
+
+# Color de cada botón 1-36 de la mesa
+_TABLE_NUMBER_COLORS = tuple(
+    (num, "red" if (RED_MASK >> num) & 1 else "black") for num in range(1, 37)
+)
+
+
+def _button_qss(bg_color: str) -> str:
+    return f"""
+            QPushButton {{
+                background-color: {bg_color};
+                color: white;
+                border: 2px solid #FCD34D;
+                border-radius: 5px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: {bg_color};
+                border: 3px solid #FBBF24;
+            }}
+        """
+
+
+# Hojas de estilo de los botones de la mesa, construidas una sola vez por color
+_QSS = {
+    "red": _button_qss("#DC2626"),
+    "black": _button_qss("#1F2937"),
+    "green": _button_qss("#059669"),
+    "blue": _button_qss("#1E40AF"),
+}
 
-class RouletteWheel(QWidget):
+
+class RouletteWheel(QGraphicsView):
     """Widget que muestra la ruleta giratoria"""
 
+    # Se emite cuando la animación del giro se detiene en el número ganador
+    spin_finished = pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(300, 300)
-        self.rotation = 0
+        self.rotation = 0.0
         self.spinning = False
-        self.target_rotation = 0
+        self.target_rotation = 0.0
         self.winning_number: Optional[int] = None
+        self._last_frame_time = 0.0
+
+        # Escena con la ruleta pre-renderizada como un único item que solo se
+        # rota; Qt repinta únicamente la región afectada por el item
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setRenderHints(
+            QPainter.RenderHint.Antialiasing
+            | QPainter.RenderHint.SmoothPixmapTransform
+        )
+        self.setBackgroundBrush(QBrush(QColor(5, 46, 22)))
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        gl_viewport = self._create_gl_viewport()
+        if gl_viewport is not None:
+            # La rotación del pixmap la resuelve la GPU; con OpenGL cada frame
+            # repinta el viewport completo, que es lo que espera Qt
+            self.setViewport(gl_viewport)
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
+        else:
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.SmartViewportUpdate
+            )
+
+        self._scene = QGraphicsScene(self)
+        self.setScene(self._scene)
+        self._wheel_item = QGraphicsPixmapItem()
+        self._wheel_item.setTransformationMode(
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self._scene.addItem(self._wheel_item)
+
+        # Indicador fijo sobre la ruleta
+        self._indicator = QGraphicsLineItem()
+        self._indicator.setPen(QPen(QColor("#FFD700"), 4))
+        self._indicator.setZValue(1)
+        self._scene.addItem(self._indicator)
 
         # Timer para animación
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.animate_spin)
 
+    @staticmethod
+    def _create_gl_viewport():
+        """Crea un viewport OpenGL con vsync, o None si no está disponible"""
+        if QOpenGLWidget is None:
+            return None
+        if QGuiApplication.platformName() in _NO_GL_PLATFORMS:
+            return None
+        surface_format = QSurfaceFormat()
+        surface_format.setSwapInterval(1)  # Sincronizado con el refresco
+        surface_format.setSamples(4)  # Antialiasing de los bordes rotados
+        viewport = QOpenGLWidget()
+        viewport.setFormat(surface_format)
+        return viewport
+
     def spin_to_number(self, number: int):
         """Inicia la animación de giro hacia un número"""
         self.winning_number = number
@@ -72,112 +242,108 @@ class RouletteWheel(QWidget):
         rotations = 5  # 5 vueltas completas
         angle_per_number = 360 / 37  # 37 números (0-36)
         target_angle = number * angle_per_number
-        self.target_rotation = int(self.rotation + (rotations * 360) + target_angle)
+        self.target_rotation = self.rotation + (rotations * 360) + target_angle
 
-        self.timer.start(20)  # 50 FPS
+        self._last_frame_time = time.monotonic()
+        self.timer.start(1000 // FPS)
 
     def animate_spin(self):
         """Anima el giro de la ruleta"""
-        if self.spinning:
-            diff = self.target_rotation - self.rotation
-
-            if abs(diff) < 2:
-                self.rotation = self.target_rotation
-                self.spinning = False
-                self.timer.stop()
-            else:
-                # Desaceleración suave
-                self.rotation += int(diff * 0.05)
-
-            self.update()
-
-    def paintEvent(self, a0):
-        """Dibuja la ruleta"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if not self.spinning:
+            return
 
-        # Centro del widget
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = min(center_x, center_y) - 10
+        now = time.monotonic()
+        dt = now - self._last_frame_time
+        self._last_frame_time = now
+        previous = self.rotation
+        diff = self.target_rotation - previous
+
+        if abs(diff) < 2:
+            self.rotation = self.target_rotation
+            self.spinning = False
+            self.timer.stop()
+        else:
+            # Desaceleración suave según el tiempo transcurrido
+            self.rotation += diff * (1 - math.exp(-dt / SPIN_DECAY_TAU))
+
+        # Solo se repinta si la ruleta se ha movido desde el último frame
+        if self.rotation != previous:
+            self._wheel_item.setRotation(self.rotation % 360)
+
+        if not self.spinning:
+            self.spin_finished.emit()
+
+    def hideEvent(self, a0):
+        """Pausa la animación mientras la ruleta no es visible"""
+        self.timer.stop()
+        super().hideEvent(a0)
+
+    def showEvent(self, a0):
+        """Reanuda un giro pausado al volver a mostrarse"""
+        super().showEvent(a0)
+        if self.spinning and not self.timer.isActive():
+            # El tiempo oculto no cuenta para la desaceleración
+            self._last_frame_time = time.monotonic()
+            self.timer.start(1000 // FPS)
+
+    def resizeEvent(self, a0):
+        """Regenera la ruleta pre-renderizada cuando cambia el tamaño"""
+        super().resizeEvent(a0)
+        width = self.viewport().width()
+        height = self.viewport().height()
+        # Origen de la escena en el centro del widget
+        self.setSceneRect(QRectF(-width / 2, -height / 2, width, height))
+
+        top = -height / 2
+        self._indicator.setLine(0, top + 10, 0, top + 30)
+
+        radius = self._wheel_radius()
+        if radius <= 0:
+            self._wheel_item.setPixmap(QPixmap())
+            return
+        pixmap = self._render_wheel_pixmap(radius)
+        half = pixmap.width() / pixmap.devicePixelRatio() / 2
+        self._wheel_item.setPixmap(pixmap)
+        self._wheel_item.setOffset(-half, -half)
+        self._wheel_item.setRotation(self.rotation % 360)
+
+    def _wheel_radius(self) -> int:
+        return min(self.width() // 2, self.height() // 2) - 10
+
+    def _render_wheel_pixmap(self, radius: int) -> QPixmap:
+        """Rasteriza una sola vez el fondo y los 37 sectores sin rotar"""
+        # Margen para el borde dorado de 3px que sobresale del radio
+        half = radius + 2
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(half * 2 * ratio), int(half * 2 * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(half, half)
+        # Rectángulo del círculo compartido por el fondo y los sectores
+        rect = QRectF(-radius, -radius, radius * 2, radius * 2)
 
         # Dibujar fondo
         painter.setBrush(QBrush(QColor("#1a1a1a")))
         painter.setPen(QPen(QColor("#FFD700"), 3))
-        painter.drawEllipse(QPointF(center_x, center_y), radius, radius)
-
-        # Dibujar sectores
-        angle_per_number = 360 / 37
-
-        # Orden de números en la ruleta europea
-        wheel_numbers = [
-            0,
-            32,
-            15,
-            19,
-            4,
-            21,
-            2,
-            25,
-            17,
-            34,
-            6,
-            27,
-            13,
-            36,
-            11,
-            30,
-            8,
-            23,
-            10,
-            5,
-            24,
-            16,
-            33,
-            1,
-            20,
-            14,
-            31,
-            9,
-            22,
-            18,
-            29,
-            7,
-            28,
-            12,
-            35,
-            3,
-            26,
-        ]
-
-        painter.save()
-        painter.translate(center_x, center_y)
-        painter.rotate(self.rotation)
-
-        for i, number in enumerate(wheel_numbers):
-            start_angle = i * angle_per_number
-
-            # Color del sector
-            if number == 0:
-                color = QColor("#006400")
-            elif number in RED_NUMBERS:
-                color = QColor("#8B0000")
-            else:
-                color = QColor("#000000")
-
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(QColor("#FFD700"), 1))
-            painter.drawPie(
-                QRectF(-radius, -radius, radius * 2, radius * 2),
-                int(start_angle * 16),
-                int(angle_per_number * 16),
-            )
+        painter.drawEllipse(rect)
 
-        painter.restore()
+        # Dibujar sectores: un trazado por color y un único contorno dorado
+        outline = QPainterPath()
+        for brush, sectors in _SECTOR_GROUPS:
+            path = QPainterPath()
+            for start_angle_16, span_16 in sectors:
+                path.moveTo(0, 0)
+                path.arcTo(rect, start_angle_16 / 16, span_16 / 16)
+                path.closeSubpath()
+            painter.fillPath(path, brush)
+            outline.addPath(path)
+        painter.strokePath(outline, _GOLD_PEN)
 
-        # Dibujar indicador
-        painter.setPen(QPen(QColor("#FFD700"), 4))
-        painter.drawLine(center_x, 10, center_x, 30)
+        painter.end()
+        return pixmap
 
 
 class RouletteTable(QWidget):
@@ -185,10 +351,30 @@ class RouletteTable(QWidget):
 
     number_clicked = pyqtSignal(int)
 
+    # Mesa compartida entre ventanas para no reconstruir sus 49 botones
+    _shared: Optional["RouletteTable"] = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.init_ui()
 
+    @classmethod
+    def get_shared(cls) -> "RouletteTable":
+        """Devuelve la mesa compartida, o una nueva si otra ventana la está usando"""
+        table = cls._shared
+        try:
+            in_use = table is not None and table.parent() is not None
+        except RuntimeError:  # El objeto C++ ya fue destruido
+            table = None
+            in_use = False
+
+        if table is None:
+            table = cls()
+            cls._shared = table
+        elif in_use:
+            return cls()
+        return table
+
     def init_ui(self):
         """Inicializa la interfaz de la mesa"""
         layout = QGridLayout(self)
@@ -200,11 +386,10 @@ class RouletteTable(QWidget):
         layout.addWidget(zero_btn, 0, 0, 3, 1)
 
         # Números 1-36 en 3 filas
-        for num in range(1, 37):
+        for num, color in _TABLE_NUMBER_COLORS:
             row = 3 - ((num - 1) % 3 + 1)  # Fila invertida (3 arriba, 1 abajo)
             col = (num - 1) // 3 + 1
 
-            color = "red" if num in RED_NUMBERS else "black"
             btn = self.create_number_button(num, color)
             layout.addWidget(btn, row, col)
 
@@ -243,64 +428,37 @@ class RouletteTable(QWidget):
         """Crea un botón para un número de la ruleta"""
         btn = QPushButton(str(number))
         btn.setFixedSize(40, 40)
-        btn.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        btn.setFont(_FONT_NUMBER_BTN)
 
         # Estilos según color
-        if color == "red":
-            bg_color = "#DC2626"
-        elif color == "black":
-            bg_color = "#1F2937"
-        else:  # green
-            bg_color = "#059669"
-
-        btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: 2px solid #FCD34D;
-                border-radius: 5px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {bg_color};
-                border: 3px solid #FBBF24;
-            }}
-        """
-        )
+        btn.setStyleSheet(_QSS.get(color, _QSS["green"]))
 
-        btn.clicked.connect(lambda: self.number_clicked.emit(number))
+        btn.setProperty("number", number)
+        btn.clicked.connect(self._on_number_clicked)
         return btn
 
+    def _on_number_clicked(self):
+        """Reemite el número guardado en el botón pulsado"""
+        btn = self.sender()
+        if btn is not None:
+            self.number_clicked.emit(btn.property("number"))
+
     def create_special_button(self, text: str, bet_id: str) -> QPushButton:
         """Crea un botón para apuestas especiales"""
         btn = QPushButton(text)
         btn.setMinimumHeight(35)
-        btn.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        btn.setFont(_FONT_SPECIAL_BTN)
 
         # Color según tipo de apuesta
-        if "red" in text.lower() or "rojo" in text.lower():
-            bg_color = "#DC2626"
-        elif "black" in text.lower() or "negro" in text.lower():
-            bg_color = "#1F2937"
+        lowered = text.lower()
+        if "red" in lowered or "rojo" in lowered:
+            color_key = "red"
+        elif "black" in lowered or "negro" in lowered:
+            color_key = "black"
         else:
-            bg_color = "#1E40AF"
+            color_key = "blue"
 
-        btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: 2px solid #FCD34D;
-                border-radius: 5px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {bg_color};
-                border: 3px solid #FBBF24;
-            }}
-        """
-        )
+        btn.setStyleSheet(_QSS[color_key])
 
         btn.setProperty("bet_id", bet_id)
         return btn
@@ -315,8 +473,22 @@ class RouletteWindow(QMainWindow):
         self.parent_window = parent
         self.current_chip_value = 10
         self._last_spin_total_bet = 0
+        # (número ganador, ganancias) del giro en curso, hasta que pare la ruleta
+        self._pending_result: Optional[tuple[int, int]] = None
+        # Últimos números ganadores, el más reciente primero
+        self._recent: deque[int] = deque(maxlen=10)
+        # Último texto puesto en cada etiqueta de update_display (None = nunca)
+        self._last_balance_text: Optional[str] = None
+        self._last_bet_total_text: Optional[str] = None
+        self._last_history_text: Optional[str] = None
         self.sound_manager = get_sound_manager(config_manager)
-        self.init_ui()
+
+        self.setWindowTitle("Ruleta Europea - Casino")
+        self.setGeometry(100, 100, 1200, 800)
+
+        # El árbol de widgets se construye en el primer show para que la
+        # ventana aparezca de inmediato y el coste de la mesa vaya al siguiente tick.
+        self._ui_built = False
 
     def _play_sound(self, method_name: str, *args, **kwargs) -> None:
         manager = self.sound_manager
@@ -326,11 +498,21 @@ class RouletteWindow(QMainWindow):
         if callable(callback):
             callback(*args, **kwargs)
 
+    def showEvent(self, a0):
+        """Programa la construcción diferida de la interfaz en el primer show."""
+        super().showEvent(a0)
+        if not self._ui_built:
+            QTimer.singleShot(0, self.ensure_ui)
+
+    def ensure_ui(self):
+        """Construye la interfaz si aún no existe (idempotente)."""
+        if self._ui_built:
+            return
+        self._ui_built = True
+        self.init_ui()
+
     def init_ui(self):
         """Inicializa la interfaz"""
-        self.setWindowTitle("Ruleta Europea - Casino")
-        self.setGeometry(100, 100, 1200, 800)
-
         # Widget central
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -340,11 +522,11 @@ class RouletteWindow(QMainWindow):
         # Header con balance
         header_layout = QHBoxLayout()
         self.balance_label = QLabel(f"Balance: ${self.game.balance}")
-        self.balance_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.balance_label.setFont(_FONT_TITLE)
         self.balance_label.setStyleSheet("color: #FFD700;")
 
         self.bet_total_label = QLabel("Total Apostado: $0")
-        self.bet_total_label.setFont(QFont("Arial", 14))
+        self.bet_total_label.setFont(_FONT_LARGE)
         self.bet_total_label.setStyleSheet("color: white;")
 
         header_layout.addWidget(self.balance_label)
@@ -359,11 +541,12 @@ class RouletteWindow(QMainWindow):
         left_panel = QVBoxLayout()
 
         self.wheel = RouletteWheel()
+        self.wheel.spin_finished.connect(self._on_spin_finished)
         left_panel.addWidget(self.wheel)
 
         # Resultado
         self.result_label = QLabel("¡Haz tus apuestas!")
-        self.result_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.result_label.setFont(_FONT_LARGE_BOLD)
         self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.result_label.setStyleSheet(
             """
@@ -377,12 +560,12 @@ class RouletteWindow(QMainWindow):
 
         # Historial
         history_label = QLabel("Historial:")
-        history_label.setFont(QFont("Arial", 12))
+        history_label.setFont(_FONT_MEDIUM)
         left_panel.addWidget(history_label)
 
         self.history_label = QLabel("No hay historial aún")
         self.history_label.setWordWrap(True)
-        self.history_label.setFont(QFont("Arial", 10))
+        self.history_label.setFont(_FONT_SMALL)
         self.history_label.setStyleSheet(
             "background-color: rgba(0, 0, 0, 0.5); padding: 10px; border-radius: 5px;"
         )
@@ -396,7 +579,7 @@ class RouletteWindow(QMainWindow):
         # Controles de fichas
         chip_layout = QHBoxLayout()
         chip_label = QLabel("Valor de ficha:")
-        chip_label.setFont(QFont("Arial", 12))
+        chip_label.setFont(_FONT_MEDIUM)
 
         self.chip_spinbox = QSpinBox()
         self.chip_spinbox.setMinimum(1)
@@ -414,7 +597,8 @@ class RouletteWindow(QMainWindow):
         # Mesa de apuestas en scroll
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        self.table = RouletteTable()
+        self.table_scroll = scroll
+        self.table = RouletteTable.get_shared()
         self.table.number_clicked.connect(self.place_number_bet)
 
         # Conectar botones especiales
@@ -430,7 +614,7 @@ class RouletteWindow(QMainWindow):
         action_layout = QHBoxLayout()
 
         self.spin_button = QPushButton("GIRAR")
-        self.spin_button.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.spin_button.setFont(_FONT_LARGE_BOLD)
         self.spin_button.setMinimumHeight(50)
         self.spin_button.setStyleSheet(
             """
@@ -452,11 +636,11 @@ class RouletteWindow(QMainWindow):
         self.spin_button.clicked.connect(self.spin_wheel)
 
         clear_button = QPushButton("Limpiar Apuestas")
-        clear_button.setFont(QFont("Arial", 12))
+        clear_button.setFont(_FONT_MEDIUM)
         clear_button.clicked.connect(self.clear_bets)
 
         back_button = QPushButton("Volver al Menú")
-        back_button.setFont(QFont("Arial", 12))
+        back_button.setFont(_FONT_MEDIUM)
         back_button.clicked.connect(self.close)
 
         action_layout.addWidget(clear_button)
@@ -475,20 +659,53 @@ class RouletteWindow(QMainWindow):
         """
         )
 
+    def _special_bet_buttons(self) -> tuple:
+        """Botones de apuestas especiales conectados a _on_special_clicked"""
+        return (
+            # Docenas
+            self.table.dozen1_btn,
+            self.table.dozen2_btn,
+            self.table.dozen3_btn,
+            # Apuestas simples
+            self.table.low_btn,
+            self.table.high_btn,
+            self.table.even_btn,
+            self.table.odd_btn,
+            self.table.red_btn,
+            self.table.black_btn,
+        )
+
     def connect_special_buttons(self):
         """Conecta los botones de apuestas especiales"""
-        # Docenas
-        self.table.dozen1_btn.clicked.connect(lambda: self.place_dozen_bet(1))
-        self.table.dozen2_btn.clicked.connect(lambda: self.place_dozen_bet(2))
-        self.table.dozen3_btn.clicked.connect(lambda: self.place_dozen_bet(3))
+        for btn in self._special_bet_buttons():
+            btn.clicked.connect(self._on_special_clicked)
 
-        # Apuestas simples
-        self.table.low_btn.clicked.connect(lambda: self.place_simple_bet("low"))
-        self.table.high_btn.clicked.connect(lambda: self.place_simple_bet("high"))
-        self.table.even_btn.clicked.connect(lambda: self.place_simple_bet("even"))
-        self.table.odd_btn.clicked.connect(lambda: self.place_simple_bet("odd"))
-        self.table.red_btn.clicked.connect(lambda: self.place_simple_bet("red"))
-        self.table.black_btn.clicked.connect(lambda: self.place_simple_bet("black"))
+    def release_table(self):
+        """Desconecta la mesa y la saca de la ventana para reutilizarla"""
+        table = getattr(self, "table", None)
+        if table is None:
+            return
+        try:
+            table.number_clicked.disconnect(self.place_number_bet)
+            for btn in self._special_bet_buttons():
+                btn.clicked.disconnect(self._on_special_clicked)
+            self.table_scroll.takeWidget()
+            table.setParent(None)
+        except (RuntimeError, TypeError):
+            # Mesa ya destruida o señales ya desconectadas
+            pass
+        self.table = None
+
+    def _on_special_clicked(self):
+        """Coloca la apuesta indicada por el bet_id del botón pulsado"""
+        btn = self.sender()
+        if btn is None:
+            return
+        bet_id = btn.property("bet_id")
+        if bet_id.startswith("dozen_"):
+            self.place_dozen_bet(int(bet_id[len("dozen_") :]))
+        else:
+            self.place_simple_bet(bet_id)
 
     def update_chip_value(self, value: int):
         """Actualiza el valor de la ficha actual"""
@@ -570,16 +787,17 @@ class RouletteWindow(QMainWindow):
         self._last_spin_total_bet = self.game.get_total_bet()
         winning_number, total_winnings = self.game.spin()
 
-        # Animar el giro
+        # El resultado se muestra cuando la ruleta emite spin_finished
+        self._pending_result = (winning_number, total_winnings)
         self.wheel.spin_to_number(winning_number)
 
-        # Mostrar resultado después de la animación
-        QTimer.singleShot(
-            3000,
-            lambda: self.show_result(
-                winning_number, total_winnings, self._last_spin_total_bet
-            ),
-        )
+    def _on_spin_finished(self):
+        """Muestra el resultado pendiente al detenerse la animación"""
+        if self._pending_result is None:
+            return
+        winning_number, total_winnings = self._pending_result
+        self._pending_result = None
+        self.show_result(winning_number, total_winnings, self._last_spin_total_bet)
 
     def show_result(self, winning_number: int, total_winnings: int, total_bet: int):
         """Muestra el resultado del giro"""
@@ -595,6 +813,7 @@ class RouletteWindow(QMainWindow):
                 f"Ganó el {winning_number} {color_text}.\nPerdiste esta ronda."
             )
 
+        self._recent.appendleft(winning_number)
         self.result_label.setText(result_text)
         self.update_display()
         self.spin_button.setEnabled(True)
@@ -621,19 +840,27 @@ class RouletteWindow(QMainWindow):
 
     def update_display(self):
         """Actualiza la visualización de balance y apuestas"""
-        self.balance_label.setText(f"Balance: ${self.game.balance}")
-        total_bet = self.game.get_total_bet()
-        self.bet_total_label.setText(f"Total Apostado: ${total_bet}")
+        # Solo se llama a setText (y se repinta) si el texto cambió
+        balance_text = f"Balance: ${self.game.balance}"
+        if balance_text != self._last_balance_text:
+            self.balance_label.setText(balance_text)
+            self._last_balance_text = balance_text
+
+        bet_total_text = f"Total Apostado: ${self.game.get_total_bet()}"
+        if bet_total_text != self._last_bet_total_text:
+            self.bet_total_label.setText(bet_total_text)
+            self._last_bet_total_text = bet_total_text
 
         # Actualizar historial
-        if self.game.history:
-            history_text = "Últimos números: " + " - ".join(
-                f"{n}" for n in reversed(self.game.history[-10:])
-            )
-            self.history_label.setText(history_text)
+        if self._recent:
+            history_text = "Últimos números: " + " - ".join(map(str, self._recent))
+            if history_text != self._last_history_text:
+                self.history_label.setText(history_text)
+                self._last_history_text = history_text
 
     def closeEvent(self, a0):
         """Maneja el cierre de la ventana"""
+        self.release_table()
         if self.parent_window:
             self.parent_window.show()
         a0.accept()
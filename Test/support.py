@@ -0,0 +1,74 @@
+"""
+Helpers compartidos por los módulos de test
+Shared fixtures for the test modules: project files and directory listings,
+packed-deck indices, in-memory config storage and the optional GUI import
+of main.
+"""
+
+import functools
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+# Linux with no display server and no offscreen Qt platform cannot load main:
+# detect it up front instead of attempting (and unwinding) the import
+HEADLESS = (
+    sys.platform.startswith("linux")
+    and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+    and os.environ.get("QT_QPA_PLATFORM") not in ("offscreen", "minimal")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def read_source(name):
+    """Text of a file under the project root, read once per process (None if missing)"""
+    try:
+        return (ROOT_DIR / name).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def listing(directory):
+    """Entries of a directory from a single scandir, keyed by name"""
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
+
+
+def card_ids(deck):
+    """Integer id (rank * 4 + suit) of every card left in a packed deck, as a list"""
+    return [r * 4 + s for r, s in zip(deck.ranks.tolist(), deck.suits.tolist())]
+
+
+def index_counts(indices, size):
+    """Occurrences of each index 0..size-1, as a list"""
+    counts = Counter(int(i) for i in indices)
+    return [counts[i] for i in range(size)]
+
+
+def memory_storage(files):
+    """ConfigManager storage backed by a dict of path -> JSON text (no disk I/O)"""
+    return files.get, files.__setitem__
+
+
+@functools.lru_cache(maxsize=1)
+def load_main():
+    """Import main once and return (module, skip_reason)
+
+    main pulls in PyQt6; without a display the module is None and
+    skip_reason explains why, ready for unittest.skipIf.
+    """
+    if HEADLESS:
+        return None, "GUI not available: no display"
+    try:
+        import main
+    except ImportError as e:
+        if not any(lib in str(e) for lib in ("libEGL", "libGL", "cannot connect to X server")):
+            raise
+        return None, f"GUI not available: {e}"
+    return main, None
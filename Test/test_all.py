@@ -7,73 +7,126 @@ Comprehensive test runner for all modules in the casino game collection.
 import unittest
 import sys
 import os
+import functools
+import importlib
+import importlib.util
+import io
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 # Add parent directory to path for imports
-ROOT_DIR = Path(__file__).resolve().parents[1]
+# abspath + dirname is plain string work; resolve() would readlink every component
+ROOT_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from Test.support import listing
+
+# Names the structure and documentation tests look for
+_MODULES = ("Poker", "Blackjack", "Ruleta", "Tragaperras")
+_EXPECTED_DIRS = _MODULES + ("Test",)
+_ESSENTIAL_FILES = (
+    "main.py",
+    "cardCommon.py",
+    "config.py",
+    "config_dialog.py",
+    "requirements.txt",
+    "README.md",
+    "roadmap.md",
+)
+_EXPECTED_TEST_FILES = (
+    "test_card_common.py",
+    "test_poker.py",
+    "test_config.py",
+    "test_main.py",
+    "test_blackjack.py",
+    "test_ruleta.py",
+    "test_tragaperras.py",
+    "test_all.py",  # This file
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path):
+    """File contents read once per process and shared by every test"""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _find_spec(name):
+    """Module spec located once per process, or None if it cannot be found"""
+    return importlib.util.find_spec(name)
+
+
+# Tokens looked for in the markdown docs. Module names are matched with their
+# exact case; the other words only need to appear in any case. The pattern is
+# a bytes one: every needle is ASCII, so the documents are never decoded.
+_DOC_WORDS = ("test", "testing", "unittest", "install", "setup", "requirement")
+_DOC_TOKEN_RE = re.compile(b'(?=(%s))' % b'|'.join(
+    re.escape(token.encode('ascii'))
+    for token in sorted(_MODULES + _DOC_WORDS, key=len, reverse=True)),
+    re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _doc_tokens(path):
+    """(module names, casefolded words) found in a document in one sweep"""
+    modules, words = set(), set()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return frozenset(), frozenset()  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            found = {token.decode('ascii') for token in _DOC_TOKEN_RE.findall(mm)}
+    for token in found:
+        if token in _MODULES:
+            modules.add(token)
+        # 'testing' also proves 'test': keep every word the match contains
+        folded = token.casefold()
+        words.update(w for w in _DOC_WORDS if w in folded)
+    return frozenset(modules), frozenset(words)
+
 
 class TestProjectStructure(unittest.TestCase):
     """Tests para verificar la estructura general del proyecto"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Directory listings shared by every test of the class
+        cls._root_entries = listing(str(ROOT_DIR))
+        cls._test_entries = listing(str(ROOT_DIR / "Test"))
+    
     def test_all_main_directories_exist(self):
         """Test that all main directories exist"""
-        expected_dirs = [
-            "Poker",
-            "Blackjack", 
-            "Ruleta",
-            "Tragaperras",
-            "Test"
-        ]
-        
-        for dir_name in expected_dirs:
-            dir_path = ROOT_DIR / dir_name
-            self.assertTrue(dir_path.exists(), f"Directory {dir_name} should exist")
-            self.assertTrue(dir_path.is_dir(), f"{dir_name} should be a directory")
+        entries = self._root_entries
+        for dir_name in _EXPECTED_DIRS:
+            entry = entries.get(dir_name)
+            self.assertIsNotNone(entry, f"Directory {dir_name} should exist")
+            self.assertTrue(entry.is_dir(), f"{dir_name} should be a directory")
     
     def test_essential_files_exist(self):
         """Test that essential project files exist"""
-        essential_files = [
-            "main.py",
-            "cardCommon.py",
-            "config.py", 
-            "config_dialog.py",
-            "requirements.txt",
-            "README.md",
-            "roadmap.md"
-        ]
-        
-        for filename in essential_files:
-            file_path = ROOT_DIR / filename
-            self.assertTrue(file_path.exists(), f"File {filename} should exist")
-            self.assertTrue(file_path.is_file(), f"{filename} should be a file")
+        # is_file() answers from the d_type the scandir already returned;
+        # DirEntry.stat() would cost one extra stat() syscall per file
+        entries = self._root_entries
+        for filename in _ESSENTIAL_FILES:
+            entry = entries.get(filename)
+            self.assertIsNotNone(entry, f"File {filename} should exist")
+            self.assertTrue(entry.is_file(), f"{filename} should be a file")
     
     def test_test_directory_structure(self):
         """Test that Test directory has proper structure"""
-        test_dir = ROOT_DIR / "Test"
-        self.assertTrue(test_dir.exists())
+        self.assertIn("Test", self._root_entries)
+        entries = self._test_entries
         
         # Should have __init__.py
-        init_file = test_dir / "__init__.py"
-        self.assertTrue(init_file.exists())
+        self.assertIn("__init__.py", entries)
         
         # Should have test files for each module
-        expected_test_files = [
-            "test_card_common.py",
-            "test_poker.py",
-            "test_config.py",
-            "test_main.py",
-            "test_blackjack.py",
-            "test_ruleta.py",
-            "test_tragaperras.py",
-            "test_all.py"  # This file
-        ]
-        
-        for test_file in expected_test_files:
-            test_path = test_dir / test_file
-            self.assertTrue(test_path.exists(), f"Test file {test_file} should exist")
+        for test_file in _EXPECTED_TEST_FILES:
+            self.assertIn(test_file, entries, f"Test file {test_file} should exist")
 
 
 class TestProjectDocumentation(unittest.TestCase):
@@ -82,35 +135,30 @@ class TestProjectDocumentation(unittest.TestCase):
     def test_readme_content(self):
         """Test that README has proper content"""
         readme_file = ROOT_DIR / "README.md"
-        with open(readme_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        modules, words = _doc_tokens(str(readme_file))
         
         # Should mention all main modules
-        modules = ["Poker", "Blackjack", "Ruleta", "Tragaperras"]
-        for module in modules:
-            self.assertIn(module, content, f"README should mention {module}")
+        for module in _MODULES:
+            self.assertIn(module, modules, f"README should mention {module}")
         
         # Should have testing section
-        content_lower = content.lower()
-        self.assertTrue(any(word in content_lower for word in 
+        self.assertTrue(any(word in words for word in 
                           ["test", "testing", "unittest"]), 
                        "README should mention testing")
         
         # Should have installation/setup instructions
-        self.assertTrue(any(word in content_lower for word in 
+        self.assertTrue(any(word in words for word in 
                           ["install", "setup", "requirement"]),
                        "README should mention installation")
     
     def test_roadmap_content(self):
         """Test that roadmap has proper content"""
         roadmap_file = ROOT_DIR / "roadmap.md"
-        with open(roadmap_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        modules, _ = _doc_tokens(str(roadmap_file))
         
         # Should mention all main modules
-        modules = ["Poker", "Blackjack", "Ruleta", "Tragaperras"]
-        for module in modules:
-            self.assertIn(module, content, f"Roadmap should mention {module}")
+        for module in _MODULES:
+            self.assertIn(module, modules, f"Roadmap should mention {module}")
     
     def test_all_modules_have_docstrings(self):
         """Test that all main modules have proper docstrings"""
@@ -121,14 +169,17 @@ class TestProjectDocumentation(unittest.TestCase):
             "config_dialog.py"
         ]
         
+        root_entries = listing(str(ROOT_DIR))
         for module_file in modules_to_check:
             file_path = ROOT_DIR / module_file
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+            if module_file in root_entries:
+                # Only the head of the file is inspected: 2 KiB covers the
+                # first ten lines of these modules
+                with open(file_path, 'rb') as f:
+                    head = f.read(2048).decode('utf-8', errors='ignore')
                 
                 # Should have module docstring
-                lines = content.strip().split('\n')
+                lines = head.strip().split('\n')
                 # Look for docstring in first few lines (after potential shebang/encoding)
                 docstring_found = False
                 for i, line in enumerate(lines[:10]):
@@ -138,7 +189,8 @@ class TestProjectDocumentation(unittest.TestCase):
                 
                 if not docstring_found:
                     # Allow for files that are primarily imports/setup
-                    if len(content) > 500:  # Only check substantial files
+                    size = root_entries[module_file].stat().st_size
+                    if size > 500:  # Only check substantial files
                         self.fail(f"{module_file} should have a module docstring")
 
 
@@ -176,10 +228,9 @@ class TestProjectCompatibility(unittest.TestCase):
             'pathlib', 'typing', 'enum', 'dataclasses'
         ]
         
+        # find_spec only locates the module; nothing is imported or executed
         for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
+            if _find_spec(module) is None:
                 self.fail(f"Required module {module} not available")
 
 
@@ -208,8 +259,7 @@ class TestModuleIntegration(unittest.TestCase):
     def test_main_ui_integration_ready(self):
         """Test that main UI is ready for all module integration"""
         main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _read_text(str(main_file))
         
         # Should import config
         self.assertIn('config', content)
@@ -218,73 +268,102 @@ class TestModuleIntegration(unittest.TestCase):
         self.assertIn('PyQt6', content)
 
 
+def _test_module_name(test):
+    """Dotted name of the test module a single test was loaded from"""
+    if type(test).__module__ == 'unittest.loader':
+        # _FailedTest: the module failed to import, its name is the method
+        return f"Test.{test._testMethodName}"
+    if type(test).__module__ == 'unittest.suite':
+        # _ErrorHolder for a fixture: "setUpClass (Test.test_x.TestFoo)"
+        return test.description.rpartition('(')[2].rstrip(')')
+    return type(test).__module__
+
+
+def _suite_module_name(suite):
+    """Dotted name of the test module a discovered suite was loaded from"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            name = _suite_module_name(test)
+            if name:
+                return name
+        else:
+            return _test_module_name(test)
+    return None
+
+
+def _discover_module_suites():
+    """(module name, suite) for each test module found by a single discover"""
+    master = unittest.defaultTestLoader.discover(
+        str(ROOT_DIR / "Test"), pattern='test_*.py', top_level_dir=str(ROOT_DIR)
+    )
+    for suite in master:
+        module_fullname = _suite_module_name(suite)
+        if module_fullname:
+            yield module_fullname, suite
+
+
+def _run_module_suite(module_fullname):
+    """Run one test module in a worker process
+
+    Returns (tests run, failures, errors, skipped count); failures and errors
+    are (test name, traceback) pairs, since test objects do not pickle.
+    """
+    test_module = importlib.import_module(module_fullname)
+    suite = unittest.defaultTestLoader.loadTestsFromModule(test_module)
+    result = unittest.TestResult()
+    suite.run(result)
+    return (result.testsRun,
+            [(str(test), tb) for test, tb in result.failures],
+            [(str(test), tb) for test, tb in result.errors],
+            len(result.skipped))
+
+
+def _print_problems(failures, errors):
+    """Print failures and errors the way TextTestRunner reports them"""
+    for flavour, entries in (("FAIL", failures), ("ERROR", errors)):
+        for name, tb in entries:
+            print("=" * 70)
+            print(f"{flavour}: {name}")
+            print("-" * 70)
+            print(tb)
+
+
+def _run_isolated(module_fullname):
+    """Run one module in a dedicated worker so a crash is attributed to it"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_module_suite, module_fullname).result()
+
+
 def run_all_tests():
     """Execute all test suites"""
     
     print("🎰 Ejecutando Suite de Tests Comprehensiva de RuleTragaperrasJuego")
     print("=" * 70)
     
-    # Import all test modules
-    test_modules = []
-    
-    try:
-        from Test import test_card_common
-        test_modules.append(('cardCommon', test_card_common))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_card_common: {e}")
-    
-    try:
-        from Test import test_poker
-        test_modules.append(('Poker', test_poker))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_poker: {e}")
-    
-    try:
-        from Test import test_config
-        test_modules.append(('Config', test_config))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_config: {e}")
-    
-    try:
-        from Test import test_main
-        test_modules.append(('Main UI', test_main))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_main: {e}")
-    
-    try:
-        from Test import test_blackjack
-        test_modules.append(('Blackjack', test_blackjack))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_blackjack: {e}")
-    
-    try:
-        from Test import test_ruleta
-        test_modules.append(('Ruleta', test_ruleta))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_ruleta: {e}")
-    
-    try:
-        from Test import test_tragaperras
-        test_modules.append(('Tragaperras', test_tragaperras))
-    except ImportError as e:
-        print(f"⚠️  Could not import test_tragaperras: {e}")
+    # Discover every Test/test_*.py in one pass; import errors become
+    # failing tests of their module instead of aborting the run
+    test_modules = [
+        (module_fullname, suite)
+        for module_fullname, suite in _discover_module_suites()
+        if module_fullname.rsplit('.', 1)[-1] != 'test_all'
+    ]
     
     # Run project structure tests first
     print("\n📁 Testing Project Structure...")
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestProjectStructure)
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestProjectStructure)
     runner = unittest.TextTestRunner(verbosity=1)
     result = runner.run(suite)
     
     print("\n📚 Testing Project Documentation...")
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestProjectDocumentation)
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestProjectDocumentation)
     result = runner.run(suite)
     
     print("\n🔧 Testing Project Compatibility...")
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestProjectCompatibility)
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestProjectCompatibility)
     result = runner.run(suite)
     
     print("\n🔗 Testing Module Integration...")
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestModuleIntegration)
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(TestModuleIntegration)
     result = runner.run(suite)
     
     # Run individual module tests
@@ -293,21 +372,89 @@ def run_all_tests():
     total_errors = 0
     total_skipped = 0
     
-    for module_name, test_module in test_modules:
-        print(f"\n🎮 Testing {module_name} Module...")
+    cpu_count = os.cpu_count() or 1
+    if cpu_count <= 2:
+        # One combined suite and a single run; the per-module lines are
+        # derived from the aggregated result afterwards
+        master = unittest.TestSuite(suite for _name, suite in test_modules)
+        module_tests = {name: suite.countTestCases() for name, suite in test_modules}
         
-        # Load all test cases from the module
-        loader = unittest.TestLoader()
-        suite = loader.loadTestsFromModule(test_module)
+        # Per-test output is captured; it is only printed if something failed
+        stream = io.StringIO()
+        runner = unittest.TextTestRunner(verbosity=0, stream=stream, buffer=True)
+        result = runner.run(master)
         
-        # Run tests
-        runner = unittest.TextTestRunner(verbosity=1)
-        result = runner.run(suite)
+        def per_module(entries):
+            counts = dict.fromkeys(module_tests, 0)
+            for test, _reason in entries:
+                name = _test_module_name(test)
+                # Fixture errors name a class: attribute them to its module
+                module = next((m for m in counts
+                               if name == m or name.startswith(m + '.')), name)
+                counts[module] = counts.get(module, 0) + 1
+            return counts
         
-        total_tests += result.testsRun
-        total_failures += len(result.failures)
-        total_errors += len(result.errors)
-        total_skipped += len(result.skipped)
+        failures = per_module(result.failures)
+        errors = per_module(result.errors)
+        skipped = per_module(result.skipped)
+        for module_name, run in module_tests.items():
+            print(f"🎮 {module_name}: {run} tests, "
+                  f"{failures[module_name]} failures, {errors[module_name]} errors, "
+                  f"{skipped[module_name]} skipped")
+        if not result.wasSuccessful():
+            print(stream.getvalue())
+        
+        total_tests = result.testsRun
+        total_failures = len(result.failures)
+        total_errors = len(result.errors)
+        total_skipped = len(result.skipped)
+    else:
+        # Each module suite runs in its own worker process
+        print(f"\n🎮 Testing {len(test_modules)} modules in parallel...")
+        # Biggest modules first (test_main, test_poker...): submitted last they
+        # would keep one worker busy while the rest of the pool sits idle
+        by_size = sorted(test_modules, key=lambda item: item[1].countTestCases(),
+                         reverse=True)
+        crashed = []
+        with ProcessPoolExecutor(max_workers=max(1, cpu_count - 2)) as executor:
+            futures = {
+                executor.submit(_run_module_suite, module_name): module_name
+                for module_name, _suite in by_size
+            }
+            for future in as_completed(futures):
+                module_name = futures[future]
+                try:
+                    run, failures, errors, skipped = future.result()
+                except BrokenProcessPool:
+                    # A worker crashed (e.g. a Qt abort) and broke the pool;
+                    # rerun this module on its own to find out whether it was it
+                    crashed.append(module_name)
+                    continue
+                except Exception as e:
+                    # The module could not even be imported in the worker
+                    run, failures, errors, skipped = 0, [], [(module_name, repr(e))], 0
+                print(f"🎮 {module_name}: {run} tests, {len(failures)} failures, "
+                      f"{len(errors)} errors, {skipped} skipped")
+                _print_problems(failures, errors)
+                
+                total_tests += run
+                total_failures += len(failures)
+                total_errors += len(errors)
+                total_skipped += skipped
+        
+        for module_name in crashed:
+            try:
+                run, failures, errors, skipped = _run_isolated(module_name)
+            except BrokenProcessPool as e:
+                run, failures, errors, skipped = 0, [], [(module_name, f"worker crashed ({e})")], 0
+            print(f"🎮 {module_name}: {run} tests, {len(failures)} failures, "
+                  f"{len(errors)} errors, {skipped} skipped")
+            _print_problems(failures, errors)
+            
+            total_tests += run
+            total_failures += len(failures)
+            total_errors += len(errors)
+            total_skipped += skipped
     
     # Print summary
     print("\n" + "=" * 70)
@@ -4,34 +4,105 @@ Tests comprehensivos para el módulo Blackjack
 Tests for blackjack.py game logic and UI components.
 """
 
+import ast
+import functools
+import os
+import re
 import unittest
 import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 # Add parent directory to path for imports
-ROOT_DIR = Path(__file__).resolve().parents[1]
+# abspath + dirname is plain string work; resolve() would readlink every component
+ROOT_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-# Test PyQt6 availability
-try:
-    from PyQt6.QtWidgets import QApplication
-    PYQT_AVAILABLE = True
-except ImportError as e:
-    if "libEGL" in str(e) or "libGL" in str(e) or "cannot connect to X server" in str(e):
-        PYQT_AVAILABLE = False
-    else:
+from Test.support import listing
+
+
+BLACKJACK_FILE = ROOT_DIR / "Blackjack" / "blackjack.py"
+
+# Source and AST of blackjack.py, set by setUpModule
+_BLACKJACK_SRC = None
+_BLACKJACK_AST = None
+
+
+def setUpModule():
+    """Read and parse blackjack.py once for every test class of the module"""
+    global _BLACKJACK_SRC, _BLACKJACK_AST
+    if _BLACKJACK_SRC is None:
+        _BLACKJACK_SRC = BLACKJACK_FILE.read_text(encoding='utf-8')
+        _BLACKJACK_AST = ast.parse(_BLACKJACK_SRC, filename=str(BLACKJACK_FILE))
+
+
+# Substrings with no structural equivalent, found in a single regex sweep.
+# The lookahead reports every needle even when it overlaps another match.
+_BLACKJACK_NEEDLES = ('MainUI', 'main', 'cards', 'deck', '..')
+_BLACKJACK_RE = re.compile('(?=(%s))' % '|'.join(
+    map(re.escape, sorted(_BLACKJACK_NEEDLES, key=len, reverse=True))))
+
+
+@functools.lru_cache(maxsize=1)
+def _blackjack_tokens():
+    """Needles of _BLACKJACK_NEEDLES present in blackjack.py"""
+    return frozenset(_BLACKJACK_RE.findall(_BLACKJACK_SRC))
+
+
+@functools.lru_cache(maxsize=1)
+def _blackjack_symbols():
+    """Classes, functions, imported names and base classes of blackjack.py
+
+    Names come from the AST, so mentions inside strings or comments
+    do not count.
+    """
+    class_nodes, funcs, imports, bases = [], [], set(), set()
+    for node in ast.walk(_BLACKJACK_AST):
+        if isinstance(node, ast.ClassDef):
+            class_nodes.append(node)
+            bases.update(b.id for b in node.bases if isinstance(b, ast.Name))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            funcs.append(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            # Every dotted component counts: 'PyQt6.QtCore' provides 'PyQt6'
+            if getattr(node, 'module', None):
+                imports.update(node.module.split('.'))
+            for alias in node.names:
+                imports.update(alias.name.split('.'))
+                if alias.asname:
+                    imports.add(alias.asname)
+    return {
+        'class_count': len(class_nodes),
+        'classes': frozenset(n.name for n in class_nodes),
+        'funcs': tuple(funcs),
+        'imports': frozenset(imports),
+        'bases': frozenset(bases),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _pyqt_available():
+    """Import PyQt6 only when a Qt-dependent test actually runs"""
+    try:
+        from PyQt6.QtWidgets import QApplication  # noqa: F401
+    except ImportError as e:
+        if "libEGL" in str(e) or "libGL" in str(e) or "cannot connect to X server" in str(e):
+            return False
         raise
+    return True
 
-try:
-    from Blackjack.blackjack import BlackjackGame, BlackJackWindow
-    BLACKJACK_AVAILABLE = True
-except ImportError as e:
-    if "libEGL" in str(e) or "libGL" in str(e):
-        BLACKJACK_AVAILABLE = False
-    else:
+
+@functools.lru_cache(maxsize=1)
+def _load_blackjack():
+    """(available, BlackjackGame, BlackJackWindow), imported on first use"""
+    try:
+        from Blackjack.blackjack import BlackjackGame, BlackJackWindow
+    except ImportError as e:
+        if "libEGL" in str(e) or "libGL" in str(e):
+            return False, None, None
         raise
+    return True, BlackjackGame, BlackJackWindow
 
 
 class TestBlackjackImports(unittest.TestCase):
@@ -39,9 +110,9 @@ class TestBlackjackImports(unittest.TestCase):
     
     def test_blackjack_module_exists(self):
         """Test that blackjack module exists"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        self.assertTrue(blackjack_file.exists())
-        self.assertTrue(blackjack_file.is_file())
+        entries = listing(str(ROOT_DIR / "Blackjack"))
+        self.assertIn("blackjack.py", entries)
+        self.assertTrue(entries["blackjack.py"].is_file())
     
     def test_blackjack_imports(self):
         """Test that blackjack can be imported"""
@@ -56,16 +127,19 @@ class TestBlackjackImports(unittest.TestCase):
                 raise
 
 
-@unittest.skipUnless(BLACKJACK_AVAILABLE, "Blackjack module not available")
 class TestBlackjackGame(unittest.TestCase):
     """Tests para la clase BlackjackGame"""
     
     def setUp(self):
+        available, BlackjackGame, _ = _load_blackjack()
+        if not available:
+            self.skipTest("Blackjack module not available")
+        self.game_class = BlackjackGame
         self.game = BlackjackGame()
     
     def test_game_creation(self):
         """Test BlackjackGame creation"""
-        self.assertIsInstance(self.game, BlackjackGame)
+        self.assertIsInstance(self.game, self.game_class)
         self.assertTrue(hasattr(self.game, 'deck'))
         self.assertTrue(hasattr(self.game, 'players_cards'))
         self.assertTrue(hasattr(self.game, 'community_cards'))
@@ -104,11 +178,15 @@ class TestBlackjackGame(unittest.TestCase):
         self.assertTrue(hasattr(self.game, 'start_new_hand'))
 
 
-@unittest.skipUnless(BLACKJACK_AVAILABLE and PYQT_AVAILABLE, "Blackjack UI not available")
 class TestBlackjackWindow(unittest.TestCase):
     """Tests para la clase BlackJackWindow"""
     
     def setUp(self):
+        available, BlackjackGame, BlackJackWindow = _load_blackjack()
+        if not (available and _pyqt_available()):
+            self.skipTest("Blackjack UI not available")
+        self.game_class = BlackjackGame
+        self.window_class = BlackJackWindow
         # Mock QApplication to avoid GUI display issues
         with patch('Blackjack.blackjack.QApplication'):
             try:
@@ -126,7 +204,7 @@ class TestBlackjackWindow(unittest.TestCase):
         if not hasattr(self, 'window'):
             self.skipTest("BlackJackWindow could not be created")
         
-        self.assertIsInstance(self.window, BlackJackWindow)
+        self.assertIsInstance(self.window, self.window_class)
         self.assertTrue(hasattr(self.window, 'game'))
     
     def test_window_has_game(self):
@@ -134,7 +212,7 @@ class TestBlackjackWindow(unittest.TestCase):
         if not hasattr(self, 'window'):
             self.skipTest("BlackJackWindow could not be created")
         
-        self.assertIsInstance(self.window.game, BlackjackGame)
+        self.assertIsInstance(self.window.game, self.game_class)
     
     def test_window_ui_methods(self):
         """Test that UI methods exist"""
@@ -160,41 +238,37 @@ class TestBlackjackFileStructure(unittest.TestCase):
     
     def test_blackjack_file_content(self):
         """Test blackjack file has expected content"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        symbols = _blackjack_symbols()
         
         # Check for essential classes
-        self.assertIn('class BlackjackGame', content)
-        self.assertIn('class BlackJackWindow', content)
+        self.assertIn('BlackjackGame', symbols['classes'])
+        self.assertIn('BlackJackWindow', symbols['classes'])
         
         # Check for PyQt6 imports
-        self.assertIn('PyQt6', content)
+        self.assertIn('PyQt6', symbols['imports'])
         
         # Check for cardCommon imports
-        self.assertIn('cardCommon', content) or self.assertIn('BaseCard', content)
+        self.assertTrue('cardCommon' in symbols['imports'] or 'BaseCard' in symbols['bases'])
     
     def test_blackjack_imports_structure(self):
         """Test blackjack imports structure"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        found = _blackjack_tokens()
+        imports = _blackjack_symbols()['imports']
         
         # Should import from parent directory
-        self.assertIn('..', content) or self.assertIn('cardCommon', content)
+        self.assertTrue('..' in found or 'cardCommon' in imports)
         
         # Should import GUI components
-        self.assertIn('QMainWindow', content)
-        self.assertIn('QWidget', content)
+        self.assertIn('QMainWindow', imports)
+        self.assertIn('QWidget', imports)
     
     def test_blackjack_directory_structure(self):
         """Test Blackjack directory structure"""
-        blackjack_dir = ROOT_DIR / "Blackjack"
-        self.assertTrue(blackjack_dir.exists())
-        self.assertTrue(blackjack_dir.is_dir())
+        root_entries = listing(str(ROOT_DIR))
+        self.assertIn("Blackjack", root_entries)
+        self.assertTrue(root_entries["Blackjack"].is_dir())
         
-        blackjack_file = blackjack_dir / "blackjack.py"
-        self.assertTrue(blackjack_file.exists())
+        self.assertIn("blackjack.py", listing(str(ROOT_DIR / "Blackjack")))
 
 
 class TestBlackjackInheritance(unittest.TestCase):
@@ -202,21 +276,21 @@ class TestBlackjackInheritance(unittest.TestCase):
     
     def test_blackjack_inherits_from_cardcommon(self):
         """Test that Blackjack uses cardCommon base classes"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        import cardCommon
+        bases = _blackjack_symbols()['bases']
+        card_bases = [getattr(cardCommon, name) for name in bases
+                      if isinstance(getattr(cardCommon, name, None), type)]
         
-        # Should use base classes
-        self.assertIn('BaseCard', content) or self.assertIn('BaseDeck', content)
+        # Should use base classes (directly or through PackedDeck)
+        self.assertTrue(any(issubclass(cls, cardCommon.BaseCard) for cls in card_bases))
+        self.assertTrue(any(issubclass(cls, cardCommon.BaseDeck) for cls in card_bases))
     
     def test_blackjack_integration_with_main(self):
         """Test that Blackjack can be integrated with main UI"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        found = _blackjack_tokens()
         
         # Should import main UI for integration
-        self.assertIn('MainUI', content) or self.assertIn('main', content)
+        self.assertTrue('MainUI' in found or 'main' in found)
 
 
 class TestBlackjackGameLogic(unittest.TestCase):
@@ -248,51 +322,43 @@ class TestBlackjackGameLogic(unittest.TestCase):
     
     def test_blackjack_card_management(self):
         """Test card management in blackjack"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        found = _blackjack_tokens()
         
         # Should have card-related attributes
-        self.assertIn('cards', content)
-        self.assertIn('deck', content)
+        self.assertIn('cards', found)
+        self.assertIn('deck', found)
 
 
 class TestBlackjackCodeQuality(unittest.TestCase):
     """Tests para la calidad del código del Blackjack"""
     
+    @classmethod
+    def setUpClass(cls):
+        symbols = _blackjack_symbols()
+        cls.class_count = symbols['class_count']
+        cls.init_count = symbols['funcs'].count('__init__')
+        cls.method_count = len(symbols['funcs'])
+    
     def test_blackjack_has_classes(self):
         """Test that blackjack has proper class definitions"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Count class definitions
-        class_count = content.count('class ')
-        self.assertGreaterEqual(class_count, 2)  # At least BlackjackGame and BlackJackWindow
+        self.assertGreaterEqual(self.class_count, 2)  # At least BlackjackGame and BlackJackWindow
     
     def test_blackjack_has_methods(self):
         """Test that blackjack classes have methods"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Should have __init__ methods
-        init_count = content.count('def __init__')
-        self.assertGreaterEqual(init_count, 2)
+        self.assertGreaterEqual(self.init_count, 2)
         
         # Should have other methods
-        method_count = content.count('def ')
-        self.assertGreater(method_count, init_count)
+        self.assertGreater(self.method_count, self.init_count)
     
     def test_blackjack_follows_naming_conventions(self):
         """Test that blackjack follows Python naming conventions"""
-        blackjack_file = ROOT_DIR / "Blackjack" / "blackjack.py"
-        with open(blackjack_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        classes = _blackjack_symbols()['classes']
         
         # Class names should be in PascalCase
-        self.assertIn('BlackjackGame', content)
-        self.assertIn('BlackJackWindow', content)
+        self.assertIn('BlackjackGame', classes)
+        self.assertIn('BlackJackWindow', classes)
 
 
 if __name__ == '__main__':
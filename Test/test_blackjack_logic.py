@@ -4,6 +4,7 @@ Comprehensive tests for Blackjack game logic implementation
 Tests the BlackjackCard, BlackjackDeck, and BlackjackGame classes
 """
 
+import copy
 import unittest
 import sys
 from pathlib import Path
@@ -14,11 +15,15 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 try:
-    from Blackjack.blackjack import BlackjackCard, BlackjackDeck, BlackjackGame, GameState
+    from Blackjack.blackjack import (
+        BlackjackCard, BlackjackDeck, BlackjackGame, GameState, _hand_value
+    )
     BLACKJACK_LOGIC_AVAILABLE = True
 except ImportError:
     BLACKJACK_LOGIC_AVAILABLE = False
 
+from Test.support import card_ids, index_counts
+
 
 @unittest.skipUnless(BLACKJACK_LOGIC_AVAILABLE, "Blackjack logic not available")
 class TestBlackjackCard(unittest.TestCase):
@@ -68,18 +73,25 @@ class TestBlackjackDeck(unittest.TestCase):
     def test_deck_has_all_cards(self):
         """Test deck contains all 52 unique cards"""
         deck = BlackjackDeck()
-        values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+        self.assertEqual(deck.RANK_NAMES, ('A', '2', '3', '4', '5', '6', '7',
+                                           '8', '9', '10', 'J', 'Q', 'K'))
+        self.assertEqual(deck.SUIT_NAMES, ('Hearts', 'Diamonds', 'Clubs', 'Spades'))
         
         # Check we have 13 cards of each suit
-        for suit in suits:
-            suit_cards = [c for c in deck.cards if c.suit == suit]
-            self.assertEqual(len(suit_cards), 13)
+        self.assertEqual(index_counts(deck.suits, 4), [13] * 4)
         
         # Check we have 4 cards of each value
-        for value in values:
-            value_cards = [c for c in deck.cards if c.value == value]
-            self.assertEqual(len(value_cards), 4)
+        self.assertEqual(index_counts(deck.ranks, 13), [4] * 13)
+    
+    def test_deck_ranks_match_cards(self):
+        """Test rank indices value the same hand as the card objects"""
+        deck = BlackjackDeck()
+        deck.shuffle()
+        cards = deck.cards[:3]
+        
+        game = BlackjackGame()
+        self.assertEqual(game.calculate_hand_value(cards),
+                         _hand_value(deck.ranks[:3]))
     
     def test_deck_deal(self):
         """Test dealing cards from deck"""
@@ -91,14 +103,14 @@ class TestBlackjackDeck(unittest.TestCase):
     def test_deck_shuffle(self):
         """Test deck shuffling"""
         deck1 = BlackjackDeck()
-        original_order = [str(c) for c in deck1.cards]
+        original_order = card_ids(deck1)
         
         deck1.shuffle()
-        shuffled_order = [str(c) for c in deck1.cards]
+        shuffled_order = card_ids(deck1)
         
         # Very unlikely to be in same order after shuffle
         # (though technically possible)
-        self.assertEqual(len(original_order), len(shuffled_order))
+        self.assertEqual(sorted(original_order), sorted(shuffled_order))
 
 
 @unittest.skipUnless(BLACKJACK_LOGIC_AVAILABLE, "Blackjack logic not available")
@@ -149,6 +161,17 @@ class TestBlackjackGameLogic(unittest.TestCase):
         ]
         self.assertEqual(self.game.calculate_hand_value(hand), 17)
     
+    def test_hand_value_from_rank_array(self):
+        """Test rank arrays (vectorized path) match the Python path"""
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy not available")
+        
+        for ranks in ([0, 9], [0, 5, 9], [0, 0, 0, 9], [12, 11, 10]):
+            array = np.array(ranks, dtype=np.uint8)
+            self.assertEqual(_hand_value(array), _hand_value(ranks))
+    
     def test_blackjack_detection(self):
         """Test Blackjack detection (21 with 2 cards)"""
         # Blackjack
@@ -203,11 +226,16 @@ class TestBlackjackGameLogic(unittest.TestCase):
 class TestBlackjackGamePlay(unittest.TestCase):
     """Tests for gameplay actions"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Deal the opening hand once; each test plays on its own copy
+        cls._template = BlackjackGame(initial_balance=1000)
+        cls._template.place_bet(100)
+        cls._template.start_new_hand()
+    
     def setUp(self):
         """Set up a game for testing"""
-        self.game = BlackjackGame(initial_balance=1000)
-        self.game.place_bet(100)
-        self.game.start_new_hand()
+        self.game = copy.deepcopy(self._template)
     
     def test_hit_adds_card(self):
         """Test that hit adds a card to player hand"""
@@ -222,6 +250,16 @@ class TestBlackjackGamePlay(unittest.TestCase):
             self.game.stand()
             self.assertEqual(self.game.state, GameState.BETTING)
     
+    def test_actions_rejected_outside_player_turn(self):
+        """Test that hit and stand leave other states untouched"""
+        for state in (GameState.BETTING, GameState.DEALER_TURN, GameState.GAME_OVER):
+            self.game.state = state
+            cards = len(self.game.player_hand)
+            self.assertFalse(self.game.hit())
+            self.assertFalse(self.game.stand())
+            self.assertEqual(self.game.state, state)
+            self.assertEqual(len(self.game.player_hand), cards)
+    
     def test_bust_detection(self):
         """Test that busting is detected"""
         # Force a bust by adding high cards
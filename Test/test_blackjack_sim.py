@@ -0,0 +1,83 @@
+"""
+Tests for the Monte Carlo blackjack simulator (Blackjack/blackjack_sim.py)
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from Blackjack import blackjack_sim
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestSimulateHands(unittest.TestCase):
+    """Tests for simulate_hands"""
+
+    def test_results_shape_and_values(self):
+        """Test one int8 outcome per hand, all within the known codes"""
+        results = blackjack_sim.simulate_hands(500, seed=1)
+
+        self.assertEqual(len(results), 500)
+        if np is not None:
+            self.assertEqual(results.dtype, np.int8)
+        valid = {blackjack_sim.LOSS, blackjack_sim.PUSH,
+                 blackjack_sim.WIN, blackjack_sim.BLACKJACK}
+        self.assertTrue(set(results.tolist()) <= valid)
+
+    def test_same_seed_same_results(self):
+        """Test that a seed reproduces the hands regardless of threading"""
+        first = blackjack_sim.simulate_hands(300, seed=42)
+        second = blackjack_sim.simulate_hands(300, seed=42)
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_hand_seeds_are_independent_of_batch_size(self):
+        """Test that hand i only depends on seed + i"""
+        small = blackjack_sim.simulate_hands(50, seed=9)
+        large = blackjack_sim.simulate_hands(200, seed=9)
+        self.assertEqual(small.tolist(), large[:50].tolist())
+
+    @unittest.skipIf(np is None, "numpy not available")
+    def test_global_numpy_random_state_untouched(self):
+        """Test that seeding the hands does not reseed np.random"""
+        state = np.random.get_state()
+        expected = np.random.random(3)
+        np.random.set_state(state)
+
+        blackjack_sim.simulate_hands(20, seed=5)
+        self.assertTrue(np.array_equal(np.random.random(3), expected))
+
+    def test_empty_simulation(self):
+        """Test simulating zero hands"""
+        results = blackjack_sim.simulate_hands(0, seed=1)
+        self.assertEqual(len(results), 0)
+        self.assertEqual(blackjack_sim.expected_return(results), 0.0)
+
+
+class TestExpectedReturn(unittest.TestCase):
+    """Tests for expected_return"""
+
+    def test_blackjack_pays_three_to_two(self):
+        """Test payouts: loss -1, push 0, win 1, blackjack 1.5"""
+        codes = [blackjack_sim.LOSS, blackjack_sim.PUSH,
+                 blackjack_sim.WIN, blackjack_sim.BLACKJACK]
+        results = np.array(codes, dtype=np.int8) if np is not None else codes
+        self.assertAlmostEqual(blackjack_sim.expected_return(results), 1.5 / 4)
+
+    def test_house_edge_is_plausible(self):
+        """Test that mimicking the dealer loses a few percent on average"""
+        results = blackjack_sim.simulate_hands(20000, seed=2024)
+        self.assertLess(blackjack_sim.expected_return(results), 0.0)
+        self.assertGreater(blackjack_sim.expected_return(results), -0.15)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -4,6 +4,7 @@ Tests comprehensivos para el módulo cardCommon.py
 Tests the abstract base classes and concrete implementations for cards and decks.
 """
 
+import copy
 import unittest
 import sys
 from pathlib import Path
@@ -13,15 +14,18 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from cardCommon import BaseCard, BaseDeck, PokerCard, PokerDeck
+from cardCommon import BaseCard, BaseDeck, PokerCard, PokerDeck, seed
+from Test.support import card_ids, index_counts
 
 
 class ConcreteCard(BaseCard):
     """Implementación concreta de BaseCard para testing"""
     
+    __slots__ = ()
+    _VALUE_MAP = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5}
+    
     def get_numeric_value(self) -> int:
-        value_map = {'A': 1, '2': 2, '3': 3, '4': 4, '5': 5}
-        return value_map.get(self.value, 1)
+        return self._VALUE_MAP.get(self.value, 1)
 
 
 class ConcreteDeck(BaseDeck):
@@ -90,8 +94,8 @@ class TestBaseDeck(unittest.TestCase):
         self.deck.shuffle()
         # Cards should still be the same, just potentially different order
         self.assertEqual(len(self.deck.cards), len(original_cards))
-        self.assertEqual(set(str(c) for c in self.deck.cards), 
-                        set(str(c) for c in original_cards))
+        # Cards hash by (value, suit), cached per card: no string formatting
+        self.assertEqual(set(self.deck.cards), set(original_cards))
     
     def test_deal_single_card(self):
         """Test dealing a single card"""
@@ -174,8 +178,13 @@ class TestPokerCard(unittest.TestCase):
 class TestPokerDeck(unittest.TestCase):
     """Tests para la implementación específica PokerDeck"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Built once; each test gets a copy of its two index arrays
+        cls._template = PokerDeck()
+    
     def setUp(self):
-        self.deck = PokerDeck()
+        self.deck = copy.deepcopy(self._template)
     
     def test_poker_deck_creation(self):
         """Test poker deck creation"""
@@ -184,16 +193,23 @@ class TestPokerDeck(unittest.TestCase):
     
     def test_poker_deck_contains_all_cards(self):
         """Test that poker deck contains all 52 unique cards"""
-        cards_set = set()
-        for card in self.deck.cards:
-            cards_set.add((card.value, card.suit))
+        # 13 cards of every suit and 4 of every value
+        self.assertEqual(index_counts(self.deck.suits, 4), [13] * 4)
+        self.assertEqual(index_counts(self.deck.ranks, 13), [4] * 13)
         
-        self.assertEqual(len(cards_set), 52)
+        # Every (value, suit) pair exactly once
+        self.assertEqual(index_counts(card_ids(self.deck), 52), [1] * 52)
+    
+    def test_poker_deck_packed_layout(self):
+        """Test that the deck stores one rank and one suit index per card"""
+        self.assertEqual(len(self.deck.ranks), 52)
+        self.assertEqual(len(self.deck.suits), 52)
+        self.assertEqual(self.deck.ranks.itemsize, 1)
+        self.assertEqual(self.deck.suits.itemsize, 1)
         
-        # Verify all values and suits are present
-        for suit in PokerCard.POKER_SUITS:
-            for value in PokerCard.POKER_VALUES:
-                self.assertIn((value, suit), cards_set)
+        first = self.deck.cards[0]
+        self.assertEqual(first.value, PokerCard.POKER_VALUES[int(self.deck.ranks[0])])
+        self.assertEqual(first.suit, PokerCard.POKER_SUITS[int(self.deck.suits[0])])
     
     def test_poker_deck_card_types(self):
         """Test that all cards in deck are PokerCard instances"""
@@ -202,12 +218,24 @@ class TestPokerDeck(unittest.TestCase):
     
     def test_poker_deck_shuffling(self):
         """Test poker deck shuffling preserves all cards"""
-        original_cards = [(c.value, c.suit) for c in self.deck.cards]
+        original_cards = card_ids(self.deck)
         self.deck.shuffle()
-        shuffled_cards = [(c.value, c.suit) for c in self.deck.cards]
+        shuffled_cards = card_ids(self.deck)
         
-        self.assertEqual(len(original_cards), len(shuffled_cards))
-        self.assertEqual(set(original_cards), set(shuffled_cards))
+        self.assertEqual(sorted(original_cards), sorted(shuffled_cards))
+    
+    def test_seed_makes_shuffle_reproducible(self):
+        """Test that seeding the shared generator repeats the shuffle order"""
+        # Later tests must not inherit a fixed shuffle order
+        self.addCleanup(seed, None)
+        seed(1234)
+        self.deck.shuffle()
+        first_order = list(self.deck.ranks)
+        
+        seed(1234)
+        self.deck.reset()
+        self.deck.shuffle()
+        self.assertEqual(list(self.deck.ranks), first_order)
     
     def test_poker_deck_dealing(self):
         """Test dealing from poker deck"""
@@ -218,6 +246,35 @@ class TestPokerDeck(unittest.TestCase):
         for card in dealt_cards:
             self.assertIsInstance(card, PokerCard)
     
+    def test_poker_deck_deals_from_top(self):
+        """Test that dealing takes the next cards and shrinks the index views"""
+        self.deck.shuffle()
+        expected = self.deck.cards[:5]
+        
+        self.assertEqual(self.deck.deal(5), expected)
+        self.assertEqual(len(self.deck.ranks), 47)
+        self.assertEqual(len(self.deck.suits), 47)
+    
+    def test_poker_deck_cards_follow_state(self):
+        """Test that the cards view reuses its objects but tracks shuffles and deals"""
+        first = self.deck.cards
+        self.assertIs(self.deck.cards[0], first[0])
+        
+        self.deck.cards.pop()
+        self.assertEqual(len(self.deck.cards), 52)
+        
+        self.assertEqual(self.deck.deal(2), first[:2])
+        self.assertEqual(self.deck.cards, first[2:])
+        
+        self.deck.shuffle()
+        self.assertEqual(self.deck.cards, self.deck._make_cards(self.deck.ranks, self.deck.suits))
+    
+    def test_poker_decks_share_card_objects(self):
+        """Test that equal cards dealt from different decks are the same object"""
+        first, second = PokerDeck(), PokerDeck()
+        for a, b in zip(first.deal(52), second.deal(52)):
+            self.assertIs(a, b)
+    
     def test_poker_deck_reset(self):
         """Test poker deck reset"""
         self.deck.deal(10)
@@ -225,6 +282,18 @@ class TestPokerDeck(unittest.TestCase):
         
         self.deck.reset()
         self.assertEqual(len(self.deck), 52)
+    
+    def test_poker_deck_reset_restores_order(self):
+        """Test that reset restores the fresh order without touching other decks"""
+        fresh = card_ids(PokerDeck())
+        self.deck.shuffle()
+        self.deck.deal(7)
+        
+        self.deck.reset()
+        self.assertEqual(card_ids(self.deck), fresh)
+        
+        self.deck.shuffle()
+        self.assertEqual(card_ids(PokerDeck()), fresh)
 
 
 class TestCardDeckIntegration(unittest.TestCase):
@@ -233,24 +302,28 @@ class TestCardDeckIntegration(unittest.TestCase):
     def test_poker_deck_card_consistency(self):
         """Test consistency between PokerDeck and PokerCard"""
         deck = PokerDeck()
+        indices = list(zip(deck.ranks.tolist(), deck.suits.tolist()))
         
         # Deal all cards and verify they are valid
         all_cards = deck.deal(52)
         self.assertEqual(len(all_cards), 52)
         
-        for card in all_cards:
-            self.assertIsInstance(card, PokerCard)
-            self.assertIn(card.value, PokerCard.POKER_VALUES)
-            self.assertIn(card.suit, PokerCard.POKER_SUITS)
-            self.assertIsInstance(card.get_numeric_value(), int)
-            self.assertGreaterEqual(card.get_numeric_value(), 2)
-            self.assertLessEqual(card.get_numeric_value(), 14)
+        for card, (rank, suit) in zip(all_cards, indices):
+            with self.subTest(card=card):
+                self.assertIsInstance(card, PokerCard)
+                self.assertIn(card.value, PokerCard.POKER_VALUES)
+                self.assertIn(card.suit, PokerCard.POKER_SUITS)
+                self.assertIsInstance(card.get_numeric_value(), int)
+                self.assertGreaterEqual(card.get_numeric_value(), 2)
+                self.assertLessEqual(card.get_numeric_value(), 14)
+                # The card is the one named by the indices it came from
+                self.assertEqual((card.value, card.suit),
+                                 (PokerDeck.RANK_NAMES[rank], PokerDeck.SUIT_NAMES[suit]))
     
     def test_card_uniqueness_in_deck(self):
         """Test that no duplicate cards exist in a fresh deck"""
         deck = PokerDeck()
-        card_strings = [str(card) for card in deck.cards]
-        self.assertEqual(len(card_strings), len(set(card_strings)))
+        self.assertEqual(len(set(card_ids(deck))), 52)
 
 
 if __name__ == '__main__':
@@ -9,7 +9,9 @@ import sys
 import os
 import json
 import tempfile
+import uuid
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -20,15 +22,37 @@ from config import (
     Language, Resolution, AnimationSpeed, ConfigManager, 
     get_text, config_manager
 )
+from Test.support import memory_storage
+
+
+_TMP = None
+
+
+def setUpModule():
+    # One directory for every test that really persists to disk
+    global _TMP
+    _TMP = tempfile.TemporaryDirectory()
+
+
+def tearDownModule():
+    _TMP.cleanup()
+
+
+def _temp_config_path():
+    """Unique config file path inside the shared temporary directory"""
+    return os.path.join(_TMP.name, f'{uuid.uuid4().hex}.json')
 
 
 class TestLanguageEnum(unittest.TestCase):
     """Tests para la enum Language"""
     
+    _EXPECTED = ((Language.ENGLISH, "en"), (Language.SPANISH, "es"))
+    
     def test_language_values(self):
         """Test Language enum values"""
-        self.assertEqual(Language.ENGLISH.value, "en")
-        self.assertEqual(Language.SPANISH.value, "es")
+        for member, expected in self._EXPECTED:
+            with self.subTest(member=member):
+                self.assertEqual(member.value, expected)
     
     def test_language_count(self):
         """Test expected number of languages"""
@@ -39,12 +63,18 @@ class TestLanguageEnum(unittest.TestCase):
 class TestResolutionEnum(unittest.TestCase):
     """Tests para la enum Resolution"""
     
+    _EXPECTED = (
+        (Resolution.HD, (1280, 720)),
+        (Resolution.FULL_HD, (1920, 1080)),
+        (Resolution.ULTRA_HD, (2560, 1440)),
+        (Resolution.AUTO, (-1, -1)),
+    )
+    
     def test_resolution_values(self):
         """Test Resolution enum values"""
-        self.assertEqual(Resolution.HD.value, (1280, 720))
-        self.assertEqual(Resolution.FULL_HD.value, (1920, 1080))
-        self.assertEqual(Resolution.ULTRA_HD.value, (2560, 1440))
-        self.assertEqual(Resolution.AUTO.value, (-1, -1))
+        for member, expected in self._EXPECTED:
+            with self.subTest(member=member):
+                self.assertEqual(member.value, expected)
     
     def test_resolution_count(self):
         """Test expected number of resolutions"""
@@ -55,12 +85,18 @@ class TestResolutionEnum(unittest.TestCase):
 class TestAnimationSpeedEnum(unittest.TestCase):
     """Tests para la enum AnimationSpeed"""
     
+    _EXPECTED = (
+        (AnimationSpeed.SLOW, 1.5),
+        (AnimationSpeed.NORMAL, 1.0),
+        (AnimationSpeed.FAST, 0.5),
+        (AnimationSpeed.DISABLED, 0.0),
+    )
+    
     def test_animation_speed_values(self):
         """Test AnimationSpeed enum values"""
-        self.assertEqual(AnimationSpeed.SLOW.value, 1.5)
-        self.assertEqual(AnimationSpeed.NORMAL.value, 1.0)
-        self.assertEqual(AnimationSpeed.FAST.value, 0.5)
-        self.assertEqual(AnimationSpeed.DISABLED.value, 0.0)
+        for member, expected in self._EXPECTED:
+            with self.subTest(member=member):
+                self.assertEqual(member.value, expected)
     
     def test_animation_speed_ordering(self):
         """Test animation speeds are logically ordered"""
@@ -72,21 +108,40 @@ class TestAnimationSpeedEnum(unittest.TestCase):
 class TestConfigManager(unittest.TestCase):
     """Tests para la clase ConfigManager"""
     
+    # Keys each default section must provide
+    _DISPLAY_KEYS = frozenset({'fullscreen', 'resolution', 'vsync'})
+    _INTERFACE_KEYS = frozenset({
+        'language', 'animation_speed', 'show_tooltips',
+        'card_animation_enabled', 'sound_enabled', 'debug_mode',
+    })
+    _GAMEPLAY_KEYS = frozenset({'auto_fold_timeout', 'confirm_actions', 'show_probability_hints'})
+    
+    # Saved-config fixtures, serialized once for the whole class
+    _PARTIAL_JSON = json.dumps({
+        'interface': {
+            'language': Language.ENGLISH.value,
+            'new_setting': 'test_value'
+        },
+        'new_section': {
+            'new_key': 'new_value'
+        }
+    })
+    _INVALID_JSON = "invalid json content {"
+    
+    @classmethod
+    def setUpClass(cls):
+        # Defaults serialized once; each test parses a fresh copy
+        cls._DEFAULT_JSON = json.dumps(ConfigManager.DEFAULT_CONFIG, separators=(',', ':'))
+    
     def setUp(self):
-        # Create a temporary config file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_config_file = os.path.join(self.temp_dir, 'test_config.json')
-        # Ensure clean state by not loading any existing config
-        self.config_manager = ConfigManager(config_file=self.temp_config_file)
+        # Keep the config in memory: most tests never need the filesystem
+        self.files = {}
+        self.temp_config_file = 'test_config.json'
+        self.config_manager = ConfigManager(
+            config_file=self.temp_config_file, storage=memory_storage(self.files)
+        )
         # Reset to defaults explicitly to ensure clean state
-        import copy
-        self.config_manager.config = copy.deepcopy(ConfigManager.DEFAULT_CONFIG)
-    
-    def tearDown(self):
-        # Clean up temporary files
-        if os.path.exists(self.temp_config_file):
-            os.remove(self.temp_config_file)
-        os.rmdir(self.temp_dir)
+        self.config_manager.config = json.loads(self._DEFAULT_JSON)
     
     def test_config_manager_creation(self):
         """Test ConfigManager creation with default values"""
@@ -99,23 +154,14 @@ class TestConfigManager(unittest.TestCase):
         """Test default configuration structure"""
         config = self.config_manager.config
         
-        # Test display section
-        self.assertIn('fullscreen', config['display'])
-        self.assertIn('resolution', config['display'])
-        self.assertIn('vsync', config['display'])
-        
-        # Test interface section
-        self.assertIn('language', config['interface'])
-        self.assertIn('animation_speed', config['interface'])
-        self.assertIn('show_tooltips', config['interface'])
-        self.assertIn('card_animation_enabled', config['interface'])
-        self.assertIn('sound_enabled', config['interface'])
-        self.assertIn('debug_mode', config['interface'])
-        
-        # Test gameplay section
-        self.assertIn('auto_fold_timeout', config['gameplay'])
-        self.assertIn('confirm_actions', config['gameplay'])
-        self.assertIn('show_probability_hints', config['gameplay'])
+        # One subset check per section; the message lists any missing keys
+        for section, keys in (
+            ('display', self._DISPLAY_KEYS),
+            ('interface', self._INTERFACE_KEYS),
+            ('gameplay', self._GAMEPLAY_KEYS),
+        ):
+            self.assertTrue(keys.issubset(config[section]),
+                            f"Missing {section} keys: {sorted(keys - config[section].keys())}")
     
     def test_get_config_value(self):
         """Test getting configuration values"""
@@ -167,6 +213,9 @@ class TestConfigManager(unittest.TestCase):
     
     def test_save_and_load_config(self):
         """Test saving and loading configuration"""
+        config_file = _temp_config_path()
+        self.config_manager = ConfigManager(config_file=config_file)  # Real file storage
+        
         # Modify configuration
         self.config_manager.set('interface', 'language', Language.ENGLISH.value)
         self.config_manager.set('display', 'fullscreen', True)
@@ -175,60 +224,66 @@ class TestConfigManager(unittest.TestCase):
         # Save configuration
         result = self.config_manager.save_config()
         self.assertTrue(result)
-        self.assertTrue(os.path.exists(self.temp_config_file))
+        self.assertTrue(os.path.exists(config_file))
         
-        # Create new config manager and load
-        new_config_manager = ConfigManager(config_file=self.temp_config_file)
+        # Drop the in-memory state and load it back from the file
+        self.config_manager.reload()
         
         # Verify loaded values
-        self.assertEqual(new_config_manager.get('interface', 'language'), Language.ENGLISH.value)
-        self.assertEqual(new_config_manager.get('display', 'fullscreen'), True)
-        self.assertEqual(new_config_manager.get('gameplay', 'auto_fold_timeout'), 60)
+        self.assertEqual(self.config_manager.get('interface', 'language'), Language.ENGLISH.value)
+        self.assertEqual(self.config_manager.get('display', 'fullscreen'), True)
+        self.assertEqual(self.config_manager.get('gameplay', 'auto_fold_timeout'), 60)
     
     def test_merge_config(self):
         """Test configuration merging"""
-        # Create a partial config
-        partial_config = {
-            'interface': {
-                'language': Language.ENGLISH.value,
-                'new_setting': 'test_value'
-            },
-            'new_section': {
-                'new_key': 'new_value'
-            }
-        }
-        
-        # Save partial config to file
-        with open(self.temp_config_file, 'w', encoding='utf-8') as f:
-            json.dump(partial_config, f)
+        # Save partial config
+        self.files[self.temp_config_file] = self._PARTIAL_JSON
         
         # Load config
-        config_manager = ConfigManager(config_file=self.temp_config_file)
+        self.config_manager.reload()
         
         # Check that partial config was merged with defaults
-        self.assertEqual(config_manager.get('interface', 'language'), Language.ENGLISH.value)
-        self.assertEqual(config_manager.get('interface', 'new_setting'), 'test_value')
-        self.assertEqual(config_manager.get('interface', 'show_tooltips'), True)  # Default preserved
-        self.assertEqual(config_manager.get('display', 'fullscreen'), False)  # Default preserved
+        config = self.config_manager
+        self.assertEqual(config.get('interface', 'language'), Language.ENGLISH.value)
+        self.assertEqual(config.get('interface', 'new_setting'), 'test_value')
+        self.assertEqual(config.get('interface', 'show_tooltips'), True)  # Default preserved
+        self.assertEqual(config.get('display', 'fullscreen'), False)  # Default preserved
     
     def test_load_invalid_config_file(self):
         """Test loading invalid JSON configuration file"""
-        # Create invalid JSON file
-        with open(self.temp_config_file, 'w', encoding='utf-8') as f:
-            f.write("invalid json content {")
+        # Create invalid JSON content
+        self.files[self.temp_config_file] = self._INVALID_JSON
         
         # Should load defaults without crashing
-        config_manager = ConfigManager(config_file=self.temp_config_file)
+        self.config_manager.reload()
         # Reset to ensure we get actual defaults, not the cached config
-        import copy
-        config_manager.config = copy.deepcopy(ConfigManager.DEFAULT_CONFIG)
-        self.assertEqual(config_manager.get('interface', 'language'), Language.SPANISH.value)
+        self.config_manager.config = json.loads(self._DEFAULT_JSON)
+        self.assertEqual(self.config_manager.get('interface', 'language'), Language.SPANISH.value)
+    
+    def test_reload_switches_file(self):
+        """Test that reload can point the same manager at another file"""
+        self.files['other.json'] = json.dumps({'gameplay': {'auto_fold_timeout': 5}})
+        self.config_manager.set('display', 'fullscreen', True)
+        
+        self.config_manager.reload('other.json')
+        self.assertEqual(self.config_manager.config_file, 'other.json')
+        self.assertEqual(self.config_manager.get('gameplay', 'auto_fold_timeout'), 5)
+        self.assertFalse(self.config_manager.is_fullscreen())  # Unsaved change dropped
+    
+    def test_save_config_to_injected_storage(self):
+        """Test that a custom storage receives the saved JSON"""
+        self.config_manager.set('gameplay', 'auto_fold_timeout', 90)
+        self.assertTrue(self.config_manager.save_config())
+        
+        saved = json.loads(self.files[self.temp_config_file])
+        self.assertEqual(saved['gameplay']['auto_fold_timeout'], 90)
+        self.assertFalse(os.path.exists(self.temp_config_file))
     
     def test_save_config_failure(self):
         """Test save configuration failure handling"""
-        # Try to save to an invalid path
-        invalid_config_manager = ConfigManager(config_file='/invalid/path/config.json')
-        result = invalid_config_manager.save_config()
+        # Make the storage write fail; no new manager, no filesystem probe
+        with patch.object(self.config_manager, '_write', side_effect=OSError("disk full")):
+            result = self.config_manager.save_config()
         self.assertFalse(result)
 
 
@@ -286,13 +341,8 @@ class TestConfigIntegration(unittest.TestCase):
     """Tests de integración para el sistema de configuración"""
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_config_file = os.path.join(self.temp_dir, 'integration_test_config.json')
-    
-    def tearDown(self):
-        if os.path.exists(self.temp_config_file):
-            os.remove(self.temp_config_file)
-        os.rmdir(self.temp_dir)
+        # Unique name per test inside the shared directory
+        self.temp_config_file = _temp_config_path()
     
     def test_full_config_workflow(self):
         """Test complete configuration workflow"""
@@ -314,20 +364,24 @@ class TestConfigIntegration(unittest.TestCase):
         save_success = config_mgr.save_config()
         self.assertTrue(save_success)
         
-        # Create new config manager (simulates app restart)
-        new_config_mgr = ConfigManager(config_file=self.temp_config_file)
-        
-        # Verify all settings were preserved
-        self.assertEqual(new_config_mgr.get('interface', 'language'), Language.ENGLISH.value)
-        self.assertTrue(new_config_mgr.is_fullscreen())
-        self.assertEqual(new_config_mgr.get_resolution(), Resolution.FULL_HD.value)
-        self.assertEqual(new_config_mgr.get('interface', 'animation_speed'), AnimationSpeed.FAST.value)
-        self.assertEqual(new_config_mgr.get('gameplay', 'auto_fold_timeout'), 45)
+        # Create new config manager (simulates app restart); a fresh instance
+        # also catches state that would leak through instance attributes
+        config_mgr = ConfigManager(config_file=self.temp_config_file)
         
-        # Verify defaults are still present for unmodified settings
-        self.assertTrue(new_config_mgr.get('interface', 'show_tooltips'))
-        self.assertTrue(new_config_mgr.get('gameplay', 'confirm_actions'))
-        self.assertFalse(new_config_mgr.get('gameplay', 'show_probability_hints'))  # Default is False
+        # Verify all settings were preserved, and defaults kept for the rest
+        expected = {
+            ('interface', 'language'): Language.ENGLISH.value,
+            ('display', 'fullscreen'): True,
+            ('interface', 'animation_speed'): AnimationSpeed.FAST.value,
+            ('gameplay', 'auto_fold_timeout'): 45,
+            ('interface', 'show_tooltips'): True,
+            ('gameplay', 'confirm_actions'): True,
+            ('gameplay', 'show_probability_hints'): False,  # Default is False
+        }
+        actual = {key: config_mgr.get(*key) for key in expected}
+        self.assertEqual(actual, expected)
+        # JSON stores the resolution as a list; get_resolution returns the tuple
+        self.assertEqual(config_mgr.get_resolution(), Resolution.FULL_HD.value)
 
 
 if __name__ == '__main__':
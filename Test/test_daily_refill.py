@@ -4,13 +4,13 @@ Tests for daily refill functionality
 Tests the auto-refill system for player balance
 """
 
+import itertools
 import unittest
 import sys
 import os
 import json
 from pathlib import Path
 from datetime import datetime
-import tempfile
 
 # Add parent directory to path for imports
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -18,6 +18,16 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from config import ConfigManager
+from Test.support import load_main, memory_storage, read_source
+
+_MAIN_SRC = read_source("main.py")
+
+# main pulls in PyQt6: without a display its tests are skipped
+_main, _GUI_SKIP = load_main()
+
+# Names defined directly on each class, for the method-existence tests
+_CFG_METHODS = frozenset(vars(ConfigManager))
+_MAIN_UI_METHODS = frozenset(vars(_main.MainUI)) if _main is not None else frozenset()
 
 
 class TestDailyRefillConfiguration(unittest.TestCase):
@@ -25,9 +35,7 @@ class TestDailyRefillConfiguration(unittest.TestCase):
     
     def test_default_config_has_daily_refill_settings(self):
         """Test that default config includes daily refill settings"""
-        from config import ConfigManager
-        
-        config = ConfigManager()
+        from config import config_manager as config
         
         # Check gameplay settings
         self.assertIsNotNone(config.get('gameplay', 'starting_balance'))
@@ -38,7 +46,7 @@ class TestDailyRefillConfiguration(unittest.TestCase):
     
     def test_default_starting_balance(self):
         """Test that default starting balance is set"""
-        config = ConfigManager()
+        from config import config_manager as config
         
         starting_balance = config.get('gameplay', 'starting_balance', 0)
         self.assertGreater(starting_balance, 0)
@@ -46,7 +54,7 @@ class TestDailyRefillConfiguration(unittest.TestCase):
     
     def test_daily_refill_enabled_by_default(self):
         """Test that daily refill is enabled by default"""
-        config = ConfigManager()
+        from config import config_manager as config
         
         daily_refill = config.get('gameplay', 'daily_refill_enabled', False)
         self.assertTrue(daily_refill)
@@ -56,19 +64,13 @@ class TestDailyRefillLogic(unittest.TestCase):
     """Tests for daily refill logic"""
     
     def setUp(self):
-        """Set up temporary config for testing"""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.config = ConfigManager(self.temp_file.name)
-    
-    def tearDown(self):
-        """Clean up temporary config file"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        """Set up an in-memory config for testing"""
+        self.files = {}
+        self.config = ConfigManager('test_config.json', storage=memory_storage(self.files))
     
     def test_check_daily_refill_method_exists(self):
         """Test that check_daily_refill method exists"""
-        self.assertTrue(hasattr(self.config, 'check_daily_refill'))
+        self.assertIn('check_daily_refill', _CFG_METHODS)
     
     def test_first_login_no_refill(self):
         """Test that first login doesn't trigger refill"""
@@ -143,23 +145,17 @@ class TestPlayerBalanceMethods(unittest.TestCase):
     """Tests for player balance getter/setter methods"""
     
     def setUp(self):
-        """Set up temporary config for testing"""
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json')
-        self.temp_file.close()
-        self.config = ConfigManager(self.temp_file.name)
-    
-    def tearDown(self):
-        """Clean up temporary config file"""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+        """Set up an in-memory config for testing"""
+        self.files = {}
+        self.config = ConfigManager('test_config.json', storage=memory_storage(self.files))
     
     def test_get_player_balance_method_exists(self):
         """Test that get_player_balance method exists"""
-        self.assertTrue(hasattr(self.config, 'get_player_balance'))
+        self.assertIn('get_player_balance', _CFG_METHODS)
     
     def test_set_player_balance_method_exists(self):
         """Test that set_player_balance method exists"""
-        self.assertTrue(hasattr(self.config, 'set_player_balance'))
+        self.assertIn('set_player_balance', _CFG_METHODS)
     
     def test_default_player_balance(self):
         """Test default player balance"""
@@ -176,8 +172,8 @@ class TestPlayerBalanceMethods(unittest.TestCase):
         """Test that player balance persists after save"""
         self.config.set_player_balance(7500)
         
-        # Create new config instance with same file
-        new_config = ConfigManager(self.temp_file.name)
+        # Create new config instance with same storage (simulates app restart)
+        new_config = ConfigManager('test_config.json', storage=memory_storage(self.files))
         balance = new_config.get_player_balance()
         
         self.assertEqual(balance, 7500)
@@ -188,17 +184,19 @@ class TestDailyRefillTranslations(unittest.TestCase):
     
     def test_refill_translation_keys_exist(self):
         """Test that translation keys for daily refill exist"""
-        from config import TRANSLATIONS, Language
+        from config import TRANSLATION_KEYSETS, Language
         
         required_keys = [
             'daily_refill_title',
             'daily_refill_message',
         ]
         
-        for lang in [Language.ENGLISH, Language.SPANISH]:
-            for key in required_keys:
-                self.assertIn(key, TRANSLATIONS[lang], 
-                            f"Missing translation key '{key}' for {lang.value}")
+        missing = sorted(
+            (lang.value, key)
+            for lang, key in itertools.product([Language.ENGLISH, Language.SPANISH], required_keys)
+            if key not in TRANSLATION_KEYSETS[lang]
+        )
+        self.assertFalse(missing, f"Missing translation keys: {missing}")
     
     def test_refill_message_has_placeholder(self):
         """Test that refill message has balance placeholder"""
@@ -216,22 +214,15 @@ class TestDailyRefillTranslations(unittest.TestCase):
 class TestDailyRefillIntegration(unittest.TestCase):
     """Integration tests for daily refill in main UI"""
     
+    @unittest.skipIf(_GUI_SKIP, _GUI_SKIP)
     def test_main_ui_has_check_daily_refill_method(self):
         """Test that MainUI has check_daily_refill method"""
-        try:
-            import main
-            self.assertTrue(hasattr(main.MainUI, 'check_daily_refill'))
-        except ImportError as e:
-            if "libEGL" in str(e) or "libGL" in str(e):
-                self.skipTest("GUI not available")
-            else:
-                raise
+        self.assertIn('check_daily_refill', _MAIN_UI_METHODS)
     
     def test_main_ui_calls_check_daily_refill(self):
         """Test that MainUI __init__ includes daily refill check"""
-        main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
+        content = _MAIN_SRC
         
         # Check that check_daily_refill is called in __init__ or init_ui
         self.assertIn('check_daily_refill', content)
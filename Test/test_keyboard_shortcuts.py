@@ -4,6 +4,8 @@ Tests for keyboard shortcuts functionality
 Tests the keyboard shortcut system in the main UI
 """
 
+import itertools
+import re
 import unittest
 import sys
 from pathlib import Path
@@ -13,48 +15,39 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from Test.support import load_main, read_source
 
+# Sources scanned by several tests
+_MAIN_SRC = read_source("main.py")
+_README_SRC = read_source("README.md")
+
+# main pulls in PyQt6: without a display its tests are skipped
+_main, _GUI_SKIP = load_main()
+
+# Names defined directly on MainUI, for the method-existence tests
+_MAIN_UI_METHODS = frozenset(vars(_main.MainUI)) if _main is not None else frozenset()
+
+
+@unittest.skipIf(_GUI_SKIP, _GUI_SKIP)
 class TestKeyboardShortcutsConfiguration(unittest.TestCase):
     """Tests for keyboard shortcuts configuration"""
     
     def test_main_module_has_shortcut_imports(self):
         """Test that main module imports necessary classes for shortcuts"""
-        try:
-            import main
-            # Check that main.py file contains QShortcut import
-            main_file = ROOT_DIR / "main.py"
-            with open(main_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            self.assertIn('QShortcut', content)
-            self.assertIn('QKeySequence', content)
-        except ImportError as e:
-            if "libEGL" in str(e) or "libGL" in str(e) or "cannot connect to X server" in str(e):
-                self.skipTest("GUI not available in headless environment")
-            else:
-                raise
+        # Check that main.py file contains QShortcut import
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
+        content = _MAIN_SRC
+        
+        self.assertIn('QShortcut', content)
+        self.assertIn('QKeySequence', content)
     
     def test_main_has_setup_shortcuts_method(self):
         """Test that MainUI has setup_shortcuts method"""
-        try:
-            import main
-            self.assertTrue(hasattr(main.MainUI, 'setup_shortcuts'))
-        except ImportError as e:
-            if "libEGL" in str(e) or "libGL" in str(e):
-                self.skipTest("GUI not available")
-            else:
-                raise
+        self.assertIn('setup_shortcuts', _MAIN_UI_METHODS)
     
     def test_main_has_toggle_fullscreen_method(self):
         """Test that MainUI has toggle_fullscreen method"""
-        try:
-            import main
-            self.assertTrue(hasattr(main.MainUI, 'toggle_fullscreen'))
-        except ImportError as e:
-            if "libEGL" in str(e) or "libGL" in str(e):
-                self.skipTest("GUI not available")
-            else:
-                raise
+        self.assertIn('toggle_fullscreen', _MAIN_UI_METHODS)
 
 
 class TestKeyboardShortcutsTranslations(unittest.TestCase):
@@ -62,17 +55,19 @@ class TestKeyboardShortcutsTranslations(unittest.TestCase):
     
     def test_shortcuts_translation_keys_exist(self):
         """Test that translation keys for shortcuts exist"""
-        from config import TRANSLATIONS, Language
+        from config import TRANSLATION_KEYSETS, Language
         
         required_keys = [
             'keyboard_shortcuts',
             'shortcuts_help',
         ]
         
-        for lang in [Language.ENGLISH, Language.SPANISH]:
-            for key in required_keys:
-                self.assertIn(key, TRANSLATIONS[lang], 
-                            f"Missing translation key '{key}' for {lang.value}")
+        missing = sorted(
+            (lang.value, key)
+            for lang, key in itertools.product([Language.ENGLISH, Language.SPANISH], required_keys)
+            if key not in TRANSLATION_KEYSETS[lang]
+        )
+        self.assertFalse(missing, f"Missing translation keys: {missing}")
     
     def test_shortcuts_help_text_content(self):
         """Test that shortcuts help text has expected content"""
@@ -94,10 +89,8 @@ class TestKeyboardShortcutsDocumentation(unittest.TestCase):
     
     def test_readme_mentions_shortcuts(self):
         """Test that README mentions keyboard shortcuts"""
-        readme_file = ROOT_DIR / "README.md"
-        if readme_file.exists():
-            with open(readme_file, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
+        if _README_SRC is not None:
+            content = _README_SRC.lower()
             
             # Should mention shortcuts or keyboard
             has_mention = any(word in content for word in [
@@ -109,17 +102,16 @@ class TestKeyboardShortcutsDocumentation(unittest.TestCase):
 class TestKeyboardShortcutsIntegration(unittest.TestCase):
     """Integration tests for keyboard shortcuts"""
     
+    # Every "(1)".."(4)" hint, found in a single pass over the source
+    _BTN_RE = re.compile(r'\([1-4]\)')
+    
     def test_button_labels_include_shortcut_hints(self):
         """Test that game buttons show shortcut hints"""
-        main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
         
         # Check that buttons include numbers in their labels
-        self.assertIn('(1)', content)
-        self.assertIn('(2)', content)
-        self.assertIn('(3)', content)
-        self.assertIn('(4)', content)
+        hints = set(self._BTN_RE.findall(_MAIN_SRC))
+        self.assertLessEqual({'(1)', '(2)', '(3)', '(4)'}, hints)
 
 
 if __name__ == '__main__':
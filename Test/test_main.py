@@ -7,6 +7,7 @@ Tests for the main UI and application entry point.
 import unittest
 import sys
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -16,6 +17,11 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from Test.support import read_source
+
+# Read once per process for the source-scanning tests
+_MAIN_SRC = read_source("main.py")
+
 # Only test the parts that don't require PyQt6 GUI
 try:
     from RuleTragaperrasJuego.main import MainUI
@@ -59,16 +65,24 @@ class TestMainUIImports(unittest.TestCase):
 class TestMainUIFunctionality(unittest.TestCase):
     """Tests para la funcionalidad de MainUI (solo si PyQt6 está disponible)"""
     
-    def setUp(self):
-        # Mock QApplication to avoid GUI display issues
-        with patch('main.QApplication') as mock_app:
-            mock_app.return_value = MagicMock()
-            try:
-                self.main_ui = MainUI()
-            except Exception as e:
-                if "libEGL" in str(e) or "cannot connect to X server" in str(e):
-                    self.skipTest("Display not available")
-                raise
+    @classmethod
+    def setUpClass(cls):
+        # Building MainUI is the expensive part of this module and every test
+        # here only reads from it: create a single instance for the class
+        # Mock QApplication to avoid GUI display issues: a plain attribute
+        # swap on the module MainUI was loaded from (RuleTragaperrasJuego.main,
+        # not a second copy imported as 'main'), restored once it is built
+        main_module = sys.modules[MainUI.__module__]
+        original_qapp = main_module.QApplication
+        main_module.QApplication = MagicMock(return_value=MagicMock())
+        try:
+            cls.main_ui = MainUI()
+        except Exception as e:
+            if "libEGL" in str(e) or "cannot connect to X server" in str(e):
+                raise unittest.SkipTest("Display not available")
+            raise
+        finally:
+            main_module.QApplication = original_qapp
     
     def test_main_ui_creation(self):
         """Test MainUI creation"""
@@ -525,9 +539,8 @@ class TestMainModuleStructure(unittest.TestCase):
     
     def test_main_file_structure(self):
         """Test basic structure of main.py file"""
-        main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
+        content = _MAIN_SRC
         
         # Check for essential imports
         self.assertIn('from PyQt6', content)
@@ -537,9 +550,8 @@ class TestMainModuleStructure(unittest.TestCase):
     
     def test_main_docstring(self):
         """Test that main module has proper documentation"""
-        main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
+        content = _MAIN_SRC
         
         # Should have imports and class definition
         self.assertIn('MainUI', content)
@@ -551,24 +563,25 @@ class TestMainIntegration(unittest.TestCase):
     
     def test_main_imports_all_dependencies(self):
         """Test that main module can import all its dependencies"""
-        dependencies_to_check = [
+        dependencies_to_check = {
             'PyQt6.QtWidgets',
-            'PyQt6.QtCore', 
+            'PyQt6.QtCore',
             'PyQt6.QtGui',
             'config',
             'config_dialog'
-        ]
-        
-        main_file = ROOT_DIR / "main.py"
-        with open(main_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        for dep in dependencies_to_check:
-            # Check if dependency is imported (allowing for various import styles)
-            self.assertTrue(
-                dep in content or dep.replace('.', ' import ') in content,
-                f"Dependency {dep} not found in main.py"
-            )
+        }
+        # Allow both "import PyQt6.QtCore" and "from PyQt6 import QtCore";
+        # longest alternatives first so 'config_dialog' is not read as 'config'
+        spellings = {dep.replace('.', ' import ') for dep in dependencies_to_check}
+        pattern = re.compile('|'.join(
+            re.escape(name)
+            for name in sorted(dependencies_to_check | spellings, key=len, reverse=True)
+        ))
+
+        self.assertIsNotNone(_MAIN_SRC, "main.py not found")
+        found = {match.replace(' import ', '.') for match in pattern.findall(_MAIN_SRC)}
+        missing = dependencies_to_check - found
+        self.assertFalse(missing, f"Dependencies not found in main.py: {sorted(missing)}")
     
     def test_main_integration_with_config(self):
         """Test that main integrates properly with config system"""
@@ -20,6 +20,13 @@ from Poker.poker_logic import (
 )
 from cardCommon import PokerCard, PokerDeck
 
+# One shared card per (value, suit); evaluate_hand never mutates its cards
+CARDS = {
+    (value, suit): PokerCard(value, suit)
+    for value in PokerCard.POKER_VALUES
+    for suit in PokerCard.POKER_SUITS
+}
+
 
 class TestGamePhase(unittest.TestCase):
     """Tests para la enum GamePhase"""
@@ -113,7 +120,7 @@ class TestPlayer(unittest.TestCase):
     def test_player_reset_for_new_hand(self):
         """Test player reset functionality"""
         # Set up player state
-        self.player.hand = [PokerCard('A', 'Corazones'), PokerCard('K', 'Picas')]
+        self.player.hand = [CARDS['A', 'Corazones'], CARDS['K', 'Picas']]
         self.player.current_bet = 50
         self.player.total_bet_in_hand = 150
         self.player.is_folded = True
@@ -237,13 +244,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_high_card(self):
         """Test hand evaluation for high card"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('J', 'Picas'),
-            PokerCard('9', 'Diamantes'),
-            PokerCard('7', 'Tréboles'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['J', 'Picas'],
+            CARDS['9', 'Diamantes'],
+            CARDS['7', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -253,13 +260,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_one_pair(self):
         """Test hand evaluation for one pair"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('A', 'Picas'),
-            PokerCard('9', 'Diamantes'),
-            PokerCard('7', 'Tréboles'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['A', 'Picas'],
+            CARDS['9', 'Diamantes'],
+            CARDS['7', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -269,13 +276,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_two_pair(self):
         """Test hand evaluation for two pair"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('A', 'Picas'),
-            PokerCard('9', 'Diamantes'),
-            PokerCard('9', 'Tréboles'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['A', 'Picas'],
+            CARDS['9', 'Diamantes'],
+            CARDS['9', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -286,13 +293,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_three_of_a_kind(self):
         """Test hand evaluation for three of a kind"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('A', 'Picas'),
-            PokerCard('A', 'Diamantes'),
-            PokerCard('9', 'Tréboles'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['A', 'Picas'],
+            CARDS['A', 'Diamantes'],
+            CARDS['9', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -302,13 +309,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_straight(self):
         """Test hand evaluation for straight"""
         cards = [
-            PokerCard('10', 'Corazones'),
-            PokerCard('J', 'Picas'),
-            PokerCard('Q', 'Diamantes'),
-            PokerCard('K', 'Tréboles'),
-            PokerCard('A', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['10', 'Corazones'],
+            CARDS['J', 'Picas'],
+            CARDS['Q', 'Diamantes'],
+            CARDS['K', 'Tréboles'],
+            CARDS['A', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -318,13 +325,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_flush(self):
         """Test hand evaluation for flush"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('J', 'Corazones'),
-            PokerCard('9', 'Corazones'),
-            PokerCard('7', 'Corazones'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['J', 'Corazones'],
+            CARDS['9', 'Corazones'],
+            CARDS['7', 'Corazones'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -334,13 +341,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_full_house(self):
         """Test hand evaluation for full house"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('A', 'Picas'),
-            PokerCard('A', 'Diamantes'),
-            PokerCard('9', 'Tréboles'),
-            PokerCard('9', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['A', 'Picas'],
+            CARDS['A', 'Diamantes'],
+            CARDS['9', 'Tréboles'],
+            CARDS['9', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -351,13 +358,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_four_of_a_kind(self):
         """Test hand evaluation for four of a kind"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('A', 'Picas'),
-            PokerCard('A', 'Diamantes'),
-            PokerCard('A', 'Tréboles'),
-            PokerCard('9', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['A', 'Picas'],
+            CARDS['A', 'Diamantes'],
+            CARDS['A', 'Tréboles'],
+            CARDS['9', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -367,13 +374,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_straight_flush(self):
         """Test hand evaluation for straight flush"""
         cards = [
-            PokerCard('9', 'Corazones'),
-            PokerCard('10', 'Corazones'),
-            PokerCard('J', 'Corazones'),
-            PokerCard('Q', 'Corazones'),
-            PokerCard('K', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['9', 'Corazones'],
+            CARDS['10', 'Corazones'],
+            CARDS['J', 'Corazones'],
+            CARDS['Q', 'Corazones'],
+            CARDS['K', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -383,13 +390,13 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_royal_flush(self):
         """Test hand evaluation for royal flush"""
         cards = [
-            PokerCard('10', 'Corazones'),
-            PokerCard('J', 'Corazones'),
-            PokerCard('Q', 'Corazones'),
-            PokerCard('K', 'Corazones'),
-            PokerCard('A', 'Corazones'),
-            PokerCard('3', 'Picas'),
-            PokerCard('2', 'Diamantes')
+            CARDS['10', 'Corazones'],
+            CARDS['J', 'Corazones'],
+            CARDS['Q', 'Corazones'],
+            CARDS['K', 'Corazones'],
+            CARDS['A', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
@@ -399,19 +406,36 @@ class TestPokerTable(unittest.TestCase):
     def test_hand_evaluation_ace_low_straight(self):
         """Test hand evaluation for ace-low straight (A-2-3-4-5)"""
         cards = [
-            PokerCard('A', 'Corazones'),
-            PokerCard('2', 'Picas'),
-            PokerCard('3', 'Diamantes'),
-            PokerCard('4', 'Tréboles'),
-            PokerCard('5', 'Corazones'),
-            PokerCard('K', 'Picas'),
-            PokerCard('Q', 'Diamantes')
+            CARDS['A', 'Corazones'],
+            CARDS['2', 'Picas'],
+            CARDS['3', 'Diamantes'],
+            CARDS['4', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['K', 'Picas'],
+            CARDS['Q', 'Diamantes']
         ]
         
         ranking, tie_breakers = self.table.evaluate_hand(cards)
         self.assertEqual(ranking, HandRanking.STRAIGHT)
         self.assertEqual(tie_breakers[0], 5)  # 5-high straight (ace low)
     
+    def test_hand_evaluation_ignores_card_order(self):
+        """Test that reordered cards give the same, independently owned result"""
+        cards = [
+            CARDS['K', 'Corazones'],
+            CARDS['K', 'Picas'],
+            CARDS['9', 'Diamantes'],
+            CARDS['7', 'Tréboles'],
+            CARDS['5', 'Corazones'],
+            CARDS['3', 'Picas'],
+            CARDS['2', 'Diamantes']
+        ]
+
+        first = self.table.evaluate_hand(cards)
+        first[1].append(0)
+        second = self.table.evaluate_hand(list(reversed(cards)))
+        self.assertEqual(second, (HandRanking.ONE_PAIR, [13, 9, 7, 5]))
+
     def test_bot_action_generation(self):
         """Test bot action generation"""
         # Set up a table with 2 players
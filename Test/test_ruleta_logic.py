@@ -14,7 +14,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 try:
-    from Ruleta.ruleta_logic import RouletteGame, Bet, BetType, RED_NUMBERS, BLACK_NUMBERS
+    from Ruleta.ruleta_logic import RouletteGame, Bet, BetType, RED_NUMBERS, BLACK_NUMBERS, RED_MASK
     RULETA_LOGIC_AVAILABLE = True
 except ImportError:
     RULETA_LOGIC_AVAILABLE = False
@@ -44,6 +44,11 @@ class TestRouletteConstants(unittest.TestCase):
         for i in range(1, 37):
             self.assertIn(i, all_colored)
 
+    def test_red_mask_matches_red_numbers(self):
+        """Test that RED_MASK has exactly the red numbers set"""
+        for i in range(37):
+            self.assertEqual(bool((RED_MASK >> i) & 1), i in RED_NUMBERS)
+
 
 @unittest.skipUnless(RULETA_LOGIC_AVAILABLE, "Ruleta logic not available")
 class TestBet(unittest.TestCase):
@@ -151,6 +156,17 @@ class TestRouletteGame(unittest.TestCase):
         self.assertLessEqual(winning_number, 36)
         self.assertEqual(len(self.game.history), 1)
         self.assertEqual(self.game.last_winning_number, winning_number)
+    
+    def test_calculate_total_winnings_many_bets(self):
+        """Test that the total matches the per-bet payouts for every number"""
+        for number in range(37):
+            self.game.place_bet(self.game.create_straight_up_bet(number, 5))
+        self.game.place_bet(self.game.create_color_bet("red", 5))
+        self.game.place_bet(self.game.create_dozen_bet(2, 5))
+        
+        for winning_number in range(37):
+            expected = sum(bet.calculate_payout(winning_number) for bet in self.game.bets)
+            self.assertEqual(self.game.calculate_total_winnings(winning_number), expected)
 
 
 @unittest.skipUnless(RULETA_LOGIC_AVAILABLE, "Ruleta logic not available")
@@ -5,6 +5,7 @@ Tests for tragaperras_logic.py and related slot machine functionality.
 Extends the existing test_tragaperras_logic.py with additional comprehensive tests.
 """
 
+import os
 import unittest
 import sys
 from pathlib import Path
@@ -45,9 +46,10 @@ class TestTragaperrasModuleStructure(unittest.TestCase):
             "tragaperras_ui.py"
         ]
         
+        # One readdir instead of a stat() per expected file
+        entries = set(os.listdir(tragaperras_dir))
         for filename in expected_files:
-            file_path = tragaperras_dir / filename
-            self.assertTrue(file_path.exists(), f"{filename} should exist")
+            self.assertIn(filename, entries, f"{filename} should exist")
     
     def test_tragaperras_logic_file_content(self):
         """Test that tragaperras_logic.py has substantial content"""
@@ -229,9 +231,10 @@ class TestTragaperrasStubFiles(unittest.TestCase):
             "tragaperras_ui.py"
         ]
         
+        entries = set(os.listdir(ROOT_DIR / "Tragaperras"))
         for filename in stub_files:
             file_path = ROOT_DIR / "Tragaperras" / filename
-            if file_path.exists():
+            if filename in entries:
                 try:
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
@@ -1,12 +1,44 @@
+"""
+Cartas y barajas comunes a los juegos del casino.
+Define las clases base de carta y baraja, la baraja empaquetada en arrays de
+índices y las variantes de póker (52 cartas) y española (40 cartas).
+"""
 from abc import ABC, abstractmethod
+from array import array
+import copy
+from functools import lru_cache
 import random
 
+try:
+    import numpy as np
+except ImportError:  # Dependencia opcional: sin ella los índices van en array('B')
+    np = None
+
+# Generadores compartidos por todas las barajas: el estado se crea una sola vez
+# por proceso en lugar de uno por baraja
+_RNG = np.random.default_rng() if np is not None else None
+_PY_RNG = random.Random()
+
+
+def seed(n):
+    """Fija la semilla de todas las barajas (barajados reproducibles en tests)"""
+    global _RNG
+    if np is not None:
+        _RNG = np.random.default_rng(n)
+    _PY_RNG.seed(n)
+
+
 class BaseCard(ABC):
     """Clase base abstracta para todas las cartas"""
     
+    # Sin __dict__ por carta: solo los atributos declarados. Las subclases
+    # declaran también __slots__ (vacío o con sus propios campos).
+    __slots__ = ('value', 'suit', '_hash')
+    
     def __init__(self, value, suit):
         self.value = value
         self.suit = suit
+        self._hash = None  # Se calcula en el primer hash()
     
     def __str__(self):
         return f"{self.value} de {self.suit}"
@@ -20,7 +52,10 @@ class BaseCard(ABC):
         return self.value == other.value and self.suit == other.suit
     
     def __hash__(self):
-        return hash((self.value, self.suit))
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.value, self.suit))
+        return h
     
     @abstractmethod
     def get_numeric_value(self) -> int:
@@ -42,7 +77,7 @@ class BaseDeck(ABC):
     
     def shuffle(self):
         """Baraja las cartas"""
-        random.shuffle(self.cards)
+        _PY_RNG.shuffle(self.cards)
     
     def deal(self, num_cards=1):
         """Reparte un número específico de cartas"""
@@ -64,48 +99,201 @@ class BaseDeck(ABC):
         return len(self.cards)
     
     def is_empty(self):
-        return len(self.cards) == 0
+        return len(self) == 0
+
+
+def _to_list(values):
+    """Índices como lista de int de Python (ndarray y array('B') tienen tolist)"""
+    return values.tolist()
+
+
+@lru_cache(maxsize=None)
+def _get_card(card_cls, value, suit):
+    """Carta compartida para cada (clase, valor, palo).
+
+    Una baraja solo tiene 52 cartas distintas: se construyen una vez por
+    proceso y todas las barajas y manos reutilizan los mismos objetos. Es
+    seguro porque ninguna carta se modifica tras crearse.
+    """
+    return card_cls(value, suit)
+
+
+def _take(values, order):
+    """Reordena un array de índices según las posiciones de ``order``"""
+    if np is not None:
+        return values[order]
+    return array(values.typecode, [values[i] for i in order])
+
+
+class PackedDeck(BaseDeck):
+    """Baraja codificada como estructura de arrays (SoA).
+
+    Cada carta es un índice de valor y uno de palo de un byte: uint8 cuando
+    numpy está disponible y array('B') de la biblioteca estándar si no.
+    Repartir solo avanza un cursor sobre los arrays; ``ranks`` y ``suits``
+    devuelven los índices de las cartas que quedan. Las subclases definen
+    CARD_CLASS, RANK_NAMES y SUIT_NAMES; los objetos carta solo se construyen
+    al repartir o al acceder a ``cards``.
+    """
+
+    CARD_CLASS = None
+    RANK_NAMES = ()
+    SUIT_NAMES = ()
+
+    def __init__(self):
+        # Los arrays son el estado de la baraja: no existe una lista self.cards
+        self._create_deck()
+
+    @classmethod
+    def _template(cls):
+        """Índices de una baraja nueva (palo a palo, valores en orden).
+
+        Se calculan una sola vez por clase; las barajas copian estos arrays
+        al crearse y los restauran al resetearse.
+        """
+        template = cls.__dict__.get('_TEMPLATE')
+        if template is None:
+            n_ranks, n_suits = len(cls.RANK_NAMES), len(cls.SUIT_NAMES)
+            if np is not None:
+                ranks = np.tile(np.arange(n_ranks, dtype=np.uint8), n_suits)
+                suits = np.repeat(np.arange(n_suits, dtype=np.uint8), n_ranks)
+                ranks.flags.writeable = suits.flags.writeable = False
+            else:
+                ranks = array('B', range(n_ranks)) * n_suits
+                suits = array('B', [s for s in range(n_suits) for _ in range(n_ranks)])
+            template = cls._TEMPLATE = (ranks, suits)
+        return template
+
+    def _create_deck(self):
+        """Crea la baraja completa copiando la plantilla de la clase"""
+        ranks, suits = self._template()
+        self._ranks = copy.copy(ranks)
+        self._suits = copy.copy(suits)
+        self._top = 0  # Posición de la siguiente carta a repartir
+        self._cards_cache = None  # Lista de cartas construida en el primer acceso
+
+    @property
+    def ranks(self):
+        """Índices de valor de las cartas que quedan en la baraja"""
+        return self._ranks[self._top:]
+
+    @property
+    def suits(self):
+        """Índices de palo de las cartas que quedan en la baraja"""
+        return self._suits[self._top:]
+
+    def _make_cards(self, ranks, suits):
+        """Construye los objetos carta correspondientes a los índices dados"""
+        card_cls = self.CARD_CLASS
+        rank_names, suit_names = self.RANK_NAMES, self.SUIT_NAMES
+        return [_get_card(card_cls, rank_names[r], suit_names[s])
+                for r, s in zip(_to_list(ranks), _to_list(suits))]
+
+    @property
+    def cards(self):
+        """Cartas que quedan en la baraja, construidas a partir de los arrays.
+
+        Los objetos se crean en el primer acceso y se reutilizan hasta que la
+        baraja se baraja o se resetea; cada acceso devuelve una lista nueva,
+        así que modificarla no altera la baraja.
+        """
+        if self._cards_cache is None:
+            self._cards_cache = self._make_cards(self.ranks, self.suits)
+        return list(self._cards_cache)
+
+    def shuffle(self):
+        """Baraja las cartas restantes permutando ambos arrays con el mismo orden"""
+        if _RNG is not None:
+            # Una sola permutación en C sobre los bytes, sin mover objetos
+            order = _RNG.permutation(len(self))
+        else:
+            order = list(range(len(self)))
+            _PY_RNG.shuffle(order)
+        top = self._top
+        self._ranks[top:] = _take(self._ranks[top:], order)
+        self._suits[top:] = _take(self._suits[top:], order)
+        self._cards_cache = None
+
+    def deal(self, num_cards=1):
+        """Reparte un número específico de cartas"""
+        if num_cards > len(self):
+            raise ValueError("No hay suficientes cartas en la baraja")
+
+        # Solo avanza el cursor: los arrays no se copian ni se recortan
+        start = self._top
+        stop = start + max(num_cards, 0)
+        self._top = stop
+        cached = self._cards_cache
+        if cached is not None:
+            # Las cartas ya construidas se reparten tal cual
+            self._cards_cache = cached[stop - start:]
+            return cached[:stop - start]
+        return self._make_cards(self._ranks[start:stop], self._suits[start:stop])
+
+    def reset(self):
+        """Resetea la baraja a su estado inicial sin reservar memoria nueva"""
+        ranks, suits = self._template()
+        if np is not None:
+            np.copyto(self._ranks, ranks)
+            np.copyto(self._suits, suits)
+        else:
+            self._ranks[:] = ranks
+            self._suits[:] = suits
+        self._top = 0
+        self._cards_cache = None
+
+    def __len__(self):
+        return len(self._ranks) - self._top
 
 
 class PokerCard(BaseCard):
     """Carta específica para póker con valores y palos estándar"""
     
+    __slots__ = ()
+    
     POKER_VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
     POKER_SUITS = ['Corazones', 'Diamantes', 'Tréboles', 'Picas']
     
+    # Valor numérico para comparaciones: '2' -> 2 ... 'A' -> 14
+    _NUMERIC_VALUE = {value: i for i, value in enumerate(POKER_VALUES, start=2)}
+    
     def __init__(self, value, suit):
-        if value not in self.POKER_VALUES:
+        if value not in _POKER_VALUES_SET:
             raise ValueError(f"Valor inválido: {value}")
-        if suit not in self.POKER_SUITS:
+        if suit not in _POKER_SUITS_SET:
             raise ValueError(f"Palo inválido: {suit}")
         super().__init__(value, suit)
     
     def get_numeric_value(self) -> int:
         """Devuelve el valor numérico de la carta para comparaciones"""
-        value_map = {
-            '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
-            '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14
-        }
-        return value_map[self.value]
+        return self._NUMERIC_VALUE[self.value]
 
 
-class PokerDeck(BaseDeck):
+# Validación O(1) por hash; las listas públicas de PokerCard no cambian
+_POKER_VALUES_SET = frozenset(PokerCard.POKER_VALUES)
+_POKER_SUITS_SET = frozenset(PokerCard.POKER_SUITS)
+
+
+class PokerDeck(PackedDeck):
     """Baraja estándar de póker de 52 cartas"""
 
-    def _create_deck(self) -> list[str]:
-        """Crea una baraja completa de póker"""
-        self.cards = []
-        for suit in PokerCard.POKER_SUITS:
-            for value in PokerCard.POKER_VALUES:
-                self.cards.append(PokerCard(value, suit))
-        return self.cards
+    CARD_CLASS = PokerCard
+    RANK_NAMES = tuple(PokerCard.POKER_VALUES)
+    SUIT_NAMES = tuple(PokerCard.POKER_SUITS)
 
 
 class SpanishCard(BaseCard):
     """Carta española con valores y palos tradicionales"""
     
+    __slots__ = ()
+    
     SPANISH_VALUES = ['1', '2', '3', '4', '5', '6', '7', 'Sota', 'Caballo', 'Rey']
     SPANISH_SUITS = ['Oros', 'Copas', 'Espadas', 'Bastos']
+    # Valor numérico para comparaciones
+    _NUMERIC_VALUE = {
+        '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7,
+        'Sota': 10, 'Caballo': 11, 'Rey': 12
+    }
     
     def __init__(self, value, suit):
         if value not in self.SPANISH_VALUES:
@@ -116,15 +304,7 @@ class SpanishCard(BaseCard):
     
     def get_numeric_value(self) -> int:
         """Devuelve el valor numérico de la carta para comparaciones"""
-        if self.value in ['1', '2', '3', '4', '5', '6', '7']:
-            return int(self.value)
-        elif self.value == 'Sota':
-            return 10
-        elif self.value == 'Caballo':
-            return 11
-        elif self.value == 'Rey':
-            return 12
-        return 0
+        return self._NUMERIC_VALUE.get(self.value, 0)
 
 
 class SpanishDeck(BaseDeck):
@@ -6,7 +6,7 @@ import json
 import os
 import copy
 from contextlib import contextmanager
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from enum import Enum
 from datetime import datetime
 
@@ -28,6 +28,25 @@ class AnimationSpeed(Enum):
     FAST = 0.5
     DISABLED = 0.0
 
+def _read_config_file(path: str) -> Optional[str]:
+    """Return the text of a config file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_config_file(path: str, text: str) -> None:
+    """Write the serialized config to disk."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+# (read_fn, write_fn) pair used by ConfigManager for offline (JSON) storage
+ConfigStorage = Tuple[Callable[[str], Optional[str]], Callable[[str, str], None]]
+_FILE_STORAGE: ConfigStorage = (_read_config_file, _write_config_file)
+
+
 class ConfigManager:
     """Manages application configuration settings"""
     
@@ -89,8 +108,11 @@ class ConfigManager:
         }
     }
     
-    def __init__(self, config_file: str = 'casino_config.json'):
+    def __init__(self, config_file: str = 'casino_config.json',
+                 storage: Optional[ConfigStorage] = None):
         self.config_file = config_file
+        # read_fn(path) -> text or None, write_fn(path, text); files by default
+        self._read, self._write = storage or _FILE_STORAGE
         self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._batch_depth = 0
         self._pending_save = False
@@ -104,13 +126,23 @@ class ConfigManager:
         if self._db_user_id is not None:
             self._load_from_postgresql()
             return
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    saved_config = json.load(f)
-                    self._merge_config(saved_config)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}. Using defaults.")
+        try:
+            text = self._read(self.config_file)
+            if text is not None:
+                self._merge_config(json.loads(text))
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}. Using defaults.")
+    
+    def reload(self, config_file: Optional[str] = None) -> None:
+        """Discard in-memory changes and load the configuration again.
+
+        Optionally points the manager at another file first. The instance and
+        its storage are reused instead of building a new ConfigManager.
+        """
+        if config_file is not None:
+            self.config_file = config_file
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self.load_config()
     
     def save_config(self) -> bool:
         """Save configuration to PostgreSQL (logged in) or JSON file (offline)."""
@@ -122,8 +154,7 @@ class ConfigManager:
             return self._save_to_postgresql()
 
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self._write(self.config_file, json.dumps(self.config, indent=2, ensure_ascii=False))
             return True
         except IOError as e:
             print(f"Error saving config: {e}")
@@ -363,8 +394,7 @@ class ConfigManager:
         """Clear the active user session and fall back to JSON/offline mode."""
         self._db_user_id = None
         self._db_username = None
-        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
-        self.load_config()
+        self.reload()
 
     def get_logged_username(self) -> Optional[str]:
         """Return the username of the currently logged-in user, or None."""
@@ -828,6 +858,9 @@ TRANSLATIONS = {
     }
 }
 
+# Translation keys per language, computed once for membership checks
+TRANSLATION_KEYSETS = {lang: frozenset(texts) for lang, texts in TRANSLATIONS.items()}
+
 def get_text(key: str, language: Optional[Language] = None) -> str:
     """Get translated text for the current language"""
     if language is None: